@@ -4,6 +4,10 @@ import argparse
 
 from cantools import tester
 from cantools import j1939
+from cantools import logreader
+from cantools import parallel
+from cantools import export
+from cantools import capture
 from cantools.errors import Error
 
 # Remove once less users are using the old package structure.
@@ -35,6 +39,8 @@ def _main():
     from .subparsers import monitor
     from .subparsers import dump
     from .subparsers import convert
+    from .subparsers import export
+    from .subparsers import record
     from .subparsers import generate_c_source
     from .subparsers import generate_cpp_source
 
@@ -42,6 +48,8 @@ def _main():
     monitor.add_subparser(subparsers)
     dump.add_subparser(subparsers)
     convert.add_subparser(subparsers)
+    export.add_subparser(subparsers)
+    record.add_subparser(subparsers)
     generate_c_source.add_subparser(subparsers)
     generate_cpp_source.add_subparser(subparsers)
 
@@ -0,0 +1,387 @@
+# Memory mapped capture files with fixed size records.
+#
+# A capture file starts with a header record, followed by one record
+# per frame. All records are RECORD_SIZE bytes, so a capture file can
+# be memory mapped as an array of records. Each frame record contains:
+#
+#   timestamp   float64, seconds
+#   frame_id    uint32
+#   flags       uint8, see FLAG_* below
+#   dlc         uint8, number of data bytes, 0 to 64
+#   reserved    uint16
+#   data        64 bytes, zero padded
+#
+# All values are little endian.
+#
+# The index file, named as the capture file with INDEX_SUFFIX
+# appended, maps frame ids to record numbers. It contains a header,
+# the sorted frame ids, start positions of each frame id in the record
+# numbers array and the record numbers array.
+
+import os
+import struct
+
+from .errors import Error
+from .logreader import Frame
+
+
+FLAG_EXTENDED_FRAME = 0x01
+FLAG_REMOTE_FRAME = 0x02
+FLAG_ERROR_FRAME = 0x04
+FLAG_FD = 0x08
+FLAG_BITRATE_SWITCH = 0x10
+FLAG_ERROR_STATE_INDICATOR = 0x20
+
+MAGIC = b'CANTCAP1'
+INDEX_MAGIC = b'CANTIDX1'
+INDEX_SUFFIX = '.idx'
+
+RECORD = struct.Struct('<dIBBH64s')
+RECORD_SIZE = RECORD.size
+HEADER_SIZE = RECORD_SIZE
+INDEX_HEADER = struct.Struct('<8sQQ')
+
+# Number of records buffered by the writer before written to the file.
+BUFFER_SIZE = 4096
+
+# Frame ids with this bit set are extended frame ids in the index.
+CAN_EFF_FLAG = 0x80000000
+
+
+def _record_dtype():
+    import numpy as np
+
+    return np.dtype([
+        ('timestamp', '<f8'),
+        ('frame_id', '<u4'),
+        ('flags', 'u1'),
+        ('dlc', 'u1'),
+        ('reserved', '<u2'),
+        ('data', 'u1', (64, ))
+    ])
+
+
+def _index_key(frame_id, is_extended_frame):
+    if is_extended_frame:
+        frame_id |= CAN_EFF_FLAG
+
+    return frame_id
+
+
+class CaptureWriter(object):
+    """Write frames to given capture file `filename`. The index file is
+    created when the writer is closed.
+
+    >>> with CaptureWriter('foo.cap') as writer:
+    ...     writer.write(1.5, 0x1f0, b'\\x01\\x02')
+
+    """
+
+    def __init__(self, filename, buffer_size=BUFFER_SIZE):
+        self._filename = filename
+        self._buffer = bytearray(buffer_size * RECORD_SIZE)
+        self._buffer_size = buffer_size
+        self._length = 0
+        self._fout = open(filename, 'wb')
+        self._fout.write(MAGIC.ljust(HEADER_SIZE, b'\x00'))
+
+    def write(self, timestamp, frame_id, data, flags=0):
+        """Write a frame with given timestamp `timestamp` in seconds, frame id
+        `frame_id`, data `data` and flags `flags`, a combination of
+        the ``FLAG_*`` constants in this module.
+
+        """
+
+        if len(data) > 64:
+            raise Error(
+                'expected at most 64 data bytes, but got {}'.format(len(data)))
+
+        RECORD.pack_into(self._buffer,
+                         self._length * RECORD_SIZE,
+                         timestamp,
+                         frame_id,
+                         flags,
+                         len(data),
+                         0,
+                         bytes(data))
+        self._length += 1
+
+        if self._length == self._buffer_size:
+            self.flush()
+
+    def write_frame(self, frame):
+        """Write given :class:`~cantools.logreader.Frame` `frame`. Frames
+        without a timestamp are written with timestamp NaN.
+
+        """
+
+        timestamp = frame.timestamp
+
+        if timestamp is None:
+            timestamp = float('nan')
+
+        self.write(timestamp,
+                   frame.frame_id,
+                   frame.data,
+                   FLAG_EXTENDED_FRAME if frame.is_extended_frame else 0)
+
+    def write_can_message(self, message):
+        """Write given python-can message `message`.
+
+        """
+
+        flags = 0
+
+        for attribute, flag in [('is_extended_id', FLAG_EXTENDED_FRAME),
+                                ('is_remote_frame', FLAG_REMOTE_FRAME),
+                                ('is_error_frame', FLAG_ERROR_FRAME),
+                                ('is_fd', FLAG_FD),
+                                ('bitrate_switch', FLAG_BITRATE_SWITCH),
+                                ('error_state_indicator',
+                                 FLAG_ERROR_STATE_INDICATOR)]:
+            if getattr(message, attribute, False):
+                flags |= flag
+
+        self.write(message.timestamp,
+                   message.arbitration_id,
+                   message.data,
+                   flags)
+
+    def flush(self):
+        self._fout.write(self._buffer[:self._length * RECORD_SIZE])
+        self._fout.flush()
+        self._length = 0
+
+    def close(self):
+        """Flush buffered frames, close the capture file and create its
+        index file.
+
+        """
+
+        self.flush()
+        self._fout.close()
+        create_index(self._filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _open_records(filename):
+    import numpy as np
+
+    with open(filename, 'rb') as fin:
+        magic = fin.read(len(MAGIC))
+
+    if magic != MAGIC:
+        raise Error(
+            "expected capture file magic {!r}, but got {!r}".format(MAGIC,
+                                                                    magic))
+
+    size = os.path.getsize(filename) - HEADER_SIZE
+
+    if size % RECORD_SIZE != 0:
+        raise Error(
+            'capture file ended with a truncated record of {} '
+            'byte(s)'.format(size % RECORD_SIZE))
+
+    if size == 0:
+        return np.zeros(0, dtype=_record_dtype())
+
+    return np.memmap(filename,
+                     dtype=_record_dtype(),
+                     mode='r',
+                     offset=HEADER_SIZE)
+
+
+def create_index(filename):
+    """Create the index file of given capture file `filename`.
+
+    """
+
+    import numpy as np
+
+    records = _open_records(filename)
+    keys = records['frame_id'].astype(np.uint32)
+    extended = (records['flags'] & FLAG_EXTENDED_FRAME) != 0
+    keys[extended] |= np.uint32(CAN_EFF_FLAG)
+    record_numbers = np.argsort(keys, kind='stable').astype(np.uint64)
+    frame_ids, starts = np.unique(keys[record_numbers], return_index=True)
+    starts = np.append(starts, len(keys)).astype(np.uint64)
+
+    with open(filename + INDEX_SUFFIX, 'wb') as fout:
+        fout.write(INDEX_HEADER.pack(INDEX_MAGIC, len(keys), len(frame_ids)))
+        fout.write(frame_ids.astype('<u4').tobytes())
+        fout.write(starts.astype('<u8').tobytes())
+        fout.write(record_numbers.astype('<u8').tobytes())
+
+
+class Capture(object):
+    """A memory mapped capture file `filename` written by
+    :class:`~cantools.capture.CaptureWriter`. Only pages of accessed
+    records are read from disk.
+
+    The index file is created if missing or out of date.
+
+    >>> capture = Capture('foo.cap')
+    >>> timestamps, signals = capture.decode_message(db.get_message_by_name('Foo'))
+
+    """
+
+    def __init__(self, filename):
+        self._filename = filename
+        self._records = _open_records(filename)
+        self._index = None
+
+    @property
+    def records(self):
+        """All records as a NumPy structured array with fields
+        ``timestamp``, ``frame_id``, ``flags``, ``dlc`` and ``data``.
+
+        """
+
+        return self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def _read_index_header(self):
+        """Returns the number of frame ids in the index file, or ``None`` if
+        missing or out of date.
+
+        """
+
+        try:
+            with open(self._filename + INDEX_SUFFIX, 'rb') as fin:
+                magic, number_of_records, number_of_frame_ids = \
+                    INDEX_HEADER.unpack(fin.read(INDEX_HEADER.size))
+        except (IOError, OSError, struct.error):
+            return None
+
+        if magic != INDEX_MAGIC or number_of_records != len(self):
+            return None
+
+        return number_of_frame_ids
+
+    def _load_index(self):
+        import numpy as np
+
+        filename = self._filename + INDEX_SUFFIX
+        number_of_frame_ids = self._read_index_header()
+
+        if number_of_frame_ids is None:
+            create_index(self._filename)
+            number_of_frame_ids = self._read_index_header()
+
+        number_of_records = len(self)
+        offset = INDEX_HEADER.size
+        frame_ids = np.fromfile(filename,
+                                dtype='<u4',
+                                count=number_of_frame_ids,
+                                offset=offset)
+        offset += 4 * number_of_frame_ids
+        starts = np.fromfile(filename,
+                             dtype='<u8',
+                             count=number_of_frame_ids + 1,
+                             offset=offset)
+        offset += 8 * (number_of_frame_ids + 1)
+
+        if number_of_records > 0:
+            record_numbers = np.memmap(filename,
+                                       dtype='<u8',
+                                       mode='r',
+                                       offset=offset,
+                                       shape=(number_of_records, ))
+        else:
+            record_numbers = np.zeros(0, dtype='<u8')
+
+        keys = {int(frame_id): i for i, frame_id in enumerate(frame_ids)}
+        self._index = (keys, starts, record_numbers)
+
+    def frame_ids(self):
+        """Returns a sorted list of ``(frame_id, is_extended_frame)`` tuples
+        of all frame ids in the capture.
+
+        """
+
+        if self._index is None:
+            self._load_index()
+
+        return sorted([(key & ~CAN_EFF_FLAG, bool(key & CAN_EFF_FLAG))
+                       for key in self._index[0]])
+
+    def record_numbers(self, frame_id, is_extended_frame=False):
+        """Returns the record numbers of all frames with given frame id, in
+        capture order.
+
+        """
+
+        if self._index is None:
+            self._load_index()
+
+        keys, starts, record_numbers = self._index
+
+        try:
+            i = keys[_index_key(frame_id, is_extended_frame)]
+        except KeyError:
+            return record_numbers[:0]
+
+        return record_numbers[int(starts[i]):int(starts[i + 1])]
+
+    def read(self, frame_id, is_extended_frame=False):
+        """Returns the records of all frames with given frame id, in capture
+        order, read using the index.
+
+        """
+
+        return self._records[self.record_numbers(frame_id,
+                                                 is_extended_frame)]
+
+    def decode_message(self, message, decode_choices=True, scaling=True):
+        """Decode all frames of given message `message` using
+        :meth:`Message.decode_batch()<.Message.decode_batch()>`.
+        Remote frames, error frames and frames shorter than the
+        message are skipped.
+
+        Returns a tuple of the timestamps and the decoded signals.
+
+        """
+
+        records = self.read(message.frame_id, message.is_extended_frame)
+        valid = ((records['flags'] & (FLAG_REMOTE_FRAME | FLAG_ERROR_FRAME)) == 0)
+        valid &= (records['dlc'] >= message.length)
+        records = records[valid]
+        decoded = message.decode_batch(records['data'][:, :message.length],
+                                       decode_choices,
+                                       scaling)
+
+        return records['timestamp'], decoded
+
+    def frames(self, chunk_size=BUFFER_SIZE):
+        """Returns a generator of :class:`~cantools.logreader.Frame` objects
+        of all data frames in the capture, read `chunk_size` records
+        at a time.
+
+        """
+
+        ignored_flags = (FLAG_REMOTE_FRAME | FLAG_ERROR_FRAME)
+
+        for start in range(0, len(self), chunk_size):
+            chunk = self._records[start:start + chunk_size]
+
+            for timestamp, frame_id, flags, dlc, data in zip(
+                    chunk['timestamp'].tolist(),
+                    chunk['frame_id'].tolist(),
+                    chunk['flags'].tolist(),
+                    chunk['dlc'].tolist(),
+                    chunk['data']):
+                if flags & ignored_flags:
+                    continue
+
+                yield Frame(timestamp,
+                            frame_id,
+                            data[:dlc].tobytes(),
+                            bool(flags & FLAG_EXTENDED_FRAME),
+                            None)
@@ -1,4 +1,5 @@
 import sys
+import binascii
 
 
 class fopen(object):
@@ -24,3 +25,30 @@ class fopen(object):
 
     def __exit__(self, exc_type, exc_value, traceback):
         self._fp.close()
+
+
+if sys.version_info[0] < 3:
+    def int_from_bytes(data, byteorder):
+        data = bytearray(data)
+
+        if byteorder == 'little':
+            data.reverse()
+
+        return int(binascii.hexlify(data) or b'0', 16)
+
+    def int_to_bytes(value, length, byteorder):
+        data = bytearray(binascii.unhexlify('{:0{}x}'.format(value,
+                                                             2 * length)))
+
+        if len(data) > length:
+            raise OverflowError('int too big to convert')
+
+        if byteorder == 'little':
+            data.reverse()
+
+        return bytes(data)
+else:
+    int_from_bytes = int.from_bytes
+
+    def int_to_bytes(value, length, byteorder):
+        return value.to_bytes(length, byteorder)
@@ -0,0 +1,603 @@
+# Vectorized encoding and decoding of many frames at once using
+# NumPy.
+
+import numpy as np
+
+from ..compat import int_to_bytes
+from .utils import format_or
+from .utils import format_and
+from .utils import scale_to_integral
+from .utils import SCALING_ROUNDING_MARGIN
+from .errors import EncodeError
+from .errors import DecodeError
+
+
+def frames_to_array(frames, number_of_bytes):
+    """Returns given frames as an (N, `number_of_bytes`) uint8 array. Give
+    `frames` as a 2-D uint8 array or a sequence of bytes-like
+    objects. Longer frames are truncated.
+
+    """
+
+    if isinstance(frames, np.ndarray):
+        if frames.ndim != 2:
+            raise DecodeError(
+                'expected a 2-D frames array, but got {} dimension(s)'.format(
+                    frames.ndim))
+
+        if frames.shape[1] < number_of_bytes:
+            raise DecodeError(
+                'expected frames of at least {} bytes, but got {}'.format(
+                    number_of_bytes,
+                    frames.shape[1]))
+
+        return frames[:, :number_of_bytes].astype(np.uint8, copy=False)
+
+    if set(map(len, frames)) == {number_of_bytes}:
+        data = b''.join(frames)
+    else:
+        data = b''.join([bytes(frame[:number_of_bytes]) for frame in frames])
+
+    if len(data) != len(frames) * number_of_bytes:
+        raise DecodeError(
+            'expected frames of at least {} bytes'.format(number_of_bytes))
+
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(frames),
+                                                       number_of_bytes)
+
+
+def _extract(frames, shift, length):
+    """Extract `length` bits at given shift from given frames, where the
+    frames are seen as little endian integers. Bits are returned as
+    an uint64 array, or an object array of Python integers for data
+    longer than 64 bits.
+
+    """
+
+    first = (shift // 8)
+    last = ((shift + length - 1) // 8)
+    offset = (shift - 8 * first)
+
+    if length > 64:
+        return np.array([
+            (int.from_bytes(frame[first:last + 1].tobytes(), 'little')
+             >> offset) & ((1 << length) - 1)
+            for frame in frames
+        ], dtype=object)
+
+    value = np.zeros(len(frames), dtype=np.uint64)
+
+    for i, index in enumerate(range(first, min(last, first + 7) + 1)):
+        value |= (frames[:, index].astype(np.uint64) << np.uint64(8 * i))
+
+    value >>= np.uint64(offset)
+
+    # A 64 bits data may span nine bytes.
+    if last - first == 8:
+        value |= (frames[:, last].astype(np.uint64)
+                  << np.uint64(64 - offset))
+
+    if length < 64:
+        value &= np.uint64((1 << length) - 1)
+
+    return value
+
+
+def _convert(raw, length, sign_bit, convert):
+    if raw.dtype == object:
+        if sign_bit:
+            raw = np.array([
+                value - (sign_bit << 1) if value & sign_bit else value
+                for value in raw
+            ], dtype=object)
+
+        return raw
+
+    if convert is not None:
+        if length == 64:
+            return raw.view(np.float64)
+
+        if length == 16:
+            raw = raw.astype(np.uint16).view(np.float16)
+        else:
+            raw = raw.astype(np.uint32).view(np.float32)
+
+        # Signaling NaNs are converted to quiet NaNs.
+        with np.errstate(invalid='ignore'):
+            return raw.astype(np.float64)
+
+    if length == 64:
+        if sign_bit:
+            return raw.view(np.int64)
+        else:
+            return raw
+
+    raw = raw.astype(np.int64)
+
+    if sign_bit:
+        raw = ((raw ^ sign_bit) - sign_bit)
+
+    return raw
+
+
+def _scale(values, scale, offset):
+    if values.dtype == np.uint64 and (scale != 1 or offset != 0):
+        values = values.astype(np.float64)
+
+    return (values * scale + offset)
+
+
+def _decode_choices(raw, values, choices):
+    """Map raw values to choice strings, or scaled values if not a
+    choice, by looking up each unique raw value only once.
+
+    """
+
+    uniques, indexes, inverse = np.unique(raw,
+                                          return_index=True,
+                                          return_inverse=True)
+    unique_values = np.empty(len(uniques), dtype=object)
+
+    for i, (unique, index) in enumerate(zip(uniques, indexes)):
+        unique_values[i] = choices.get(int(unique), values[index])
+
+    return unique_values[inverse.reshape(-1)]
+
+
+def _decode_node(node,
+                 frames,
+                 reversed_frames,
+                 active,
+                 decoded,
+                 raws,
+                 masks,
+                 decode_choices,
+                 scaling):
+    plan = node['decode_plan']
+
+    if plan.number_of_bits > 8 * frames.shape[1]:
+        raise DecodeError(
+            'unpack requires at least {} bits to unpack (got {})'.format(
+                plan.number_of_bits,
+                8 * frames.shape[1]))
+
+    for (name,
+         is_big_endian,
+         shift,
+         mask,
+         sign_bit,
+         convert,
+         scale,
+         offset,
+         choices) in plan.items:
+        if name in masks:
+            masks[name] |= active
+            continue
+
+        length = mask.bit_length()
+
+        if is_big_endian:
+            raw = _extract(reversed_frames, shift, length)
+        else:
+            raw = _extract(frames, shift, length)
+
+        values = _convert(raw, length, sign_bit, convert)
+        raws[name] = values
+
+        if scaling:
+            values = _scale(values, scale, offset)
+
+        if decode_choices and choices and convert is None:
+            values = _decode_choices(raws[name], values, choices)
+
+        decoded[name] = values
+        masks[name] = active.copy()
+
+    for signal, multiplexers in node['multiplexers'].items():
+        mux = raws[signal]
+
+        for multiplexer_id, child in multiplexers.items():
+            _decode_node(child,
+                         frames,
+                         reversed_frames,
+                         active & (mux == multiplexer_id),
+                         decoded,
+                         raws,
+                         masks,
+                         decode_choices,
+                         scaling)
+
+
+def decode_batch(codecs, frames, number_of_bytes, decode_choices, scaling):
+    """Decode given frames using given codec tree of decode plans. Signals
+    not present in a frame, because of multiplexing, are decoded as
+    NaN.
+
+    """
+
+    frames = frames_to_array(frames, number_of_bytes)
+    decoded = {}
+    masks = {}
+    _decode_node(codecs,
+                 frames,
+                 frames[:, ::-1],
+                 np.ones(len(frames), dtype=bool),
+                 decoded,
+                 {},
+                 masks,
+                 decode_choices,
+                 scaling)
+
+    for name, mask in masks.items():
+        if mask.all():
+            continue
+
+        values = decoded[name]
+
+        if values.dtype != object:
+            values = values.astype(np.float64)
+
+        values[~mask] = np.nan
+        decoded[name] = values
+
+    return decoded
+
+
+def _column_to_array(values):
+    """Returns given column as an array. Sequences mixing choice strings
+    and numbers become object arrays, as NumPy would otherwise convert
+    the numbers to strings.
+
+    """
+
+    array = np.asarray(values)
+
+    if array.dtype.kind in 'US' and not isinstance(values, np.ndarray):
+        array = np.asarray(values, dtype=object)
+
+    return array
+
+
+def _column_to_numbers(field, values):
+    """Returns given column values with choice strings replaced by their
+    numbers, and a mask of the replaced values.
+
+    """
+
+    if values.dtype.kind not in 'OUS':
+        return values, None
+
+    numbers = np.empty(len(values), dtype=object)
+    is_choice = np.zeros(len(values), dtype=bool)
+    cache = {}
+
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            try:
+                number = cache[value]
+            except KeyError:
+                number = field.choice_string_to_number(value)
+
+                if number is None:
+                    raise EncodeError(
+                        "Expected a choice of signal '{}', but got '{}'.".format(
+                            field.name,
+                            value))
+
+                cache[value] = number
+
+            numbers[i] = number
+            is_choice[i] = True
+        else:
+            numbers[i] = value
+
+    if not is_choice.any():
+        return numbers, None
+
+    return numbers, is_choice
+
+
+def _scale_to_integral_batch(values, scale, offset, scaling_type):
+    """Vectorized version of the scaling in
+    :func:`~cantools.database.utils.encode_data_with_plan()`, giving
+    identical results.
+
+    """
+
+    if values.dtype == np.uint64:
+        values = values.astype(object)
+    elif values.dtype.kind == 'u':
+        values = values.astype(np.int64)
+
+    if scaling_type == 'integer' and values.dtype.kind == 'i':
+        return values - offset
+
+    if scaling_type != 'decimal' and values.dtype.kind in 'if':
+        quotient = (values.astype(np.float64) - offset) / scale
+        integral = np.floor(quotient)
+        fraction = (quotient - integral)
+        integral += (fraction > 0.5)
+        ambiguous = ~(np.abs(fraction - 0.5)
+                      > SCALING_ROUNDING_MARGIN * np.abs(quotient))
+
+        if not ambiguous.any():
+            return integral.astype(np.int64)
+
+        raws = integral.astype(object)
+    else:
+        raws = np.empty(len(values), dtype=object)
+        ambiguous = np.ones(len(values), dtype=bool)
+
+    for i in np.flatnonzero(ambiguous):
+        value = values[i]
+
+        if isinstance(value, np.generic):
+            value = value.item()
+
+        raws[i] = int(scale_to_integral(value, scale, offset))
+
+    return raws
+
+
+def _raw_to_array(raws, minimum, maximum, fmt):
+    """Returns given raw values as an array of integers after checking
+    them against given limits.
+
+    """
+
+    if raws.dtype.kind == 'f':
+        if np.isnan(raws).any():
+            raise ValueError('cannot convert float NaN to integer')
+
+        # Truncate as int() does.
+        raws = np.trunc(raws)
+
+        if len(raws) > 0 and (raws.min() < -2 ** 63 or raws.max() >= 2 ** 63):
+            raws = raws.astype(object)
+        else:
+            raws = raws.astype(np.int64)
+
+    if raws.dtype == object:
+        raws = np.array([int(raw) for raw in raws], dtype=object)
+
+    if len(raws) == 0:
+        return raws
+
+    low = raws.min()
+    high = raws.max()
+
+    if low < minimum or high > maximum:
+        raise EncodeError(
+            '"{}" requires {} <= integer <= {} (got {})'.format(
+                fmt,
+                minimum,
+                maximum,
+                low if low < minimum else high))
+
+    return raws
+
+
+def _insert(frames, rows, raws, shift, length):
+    """Insert given raw values into given rows of given frames, where the
+    frames are seen as little endian integers.
+
+    """
+
+    first = (shift // 8)
+    last = ((shift + length - 1) // 8)
+    offset = (shift - 8 * first)
+
+    if length > 64 or raws.dtype == object:
+        mask = ((1 << length) - 1)
+
+        for row, raw in zip(rows, raws):
+            value = ((int(raw) & mask) << offset)
+
+            for i, index in enumerate(range(first, last + 1)):
+                frames[row, index] |= ((value >> (8 * i)) & 0xff)
+
+        return
+
+    if length < 64:
+        raws = (raws.astype(np.int64).view(np.uint64)
+                & np.uint64((1 << length) - 1))
+    else:
+        raws = raws.astype(np.int64).view(np.uint64)
+
+    for i, index in enumerate(range(first, last + 1)):
+        position = (8 * i - offset)
+
+        if position >= 0:
+            byte = (raws >> np.uint64(position))
+        else:
+            byte = (raws << np.uint64(-position))
+
+        frames[rows, index] |= (byte & np.uint64(0xff)).astype(np.uint8)
+
+
+def _float_to_raw(values, length):
+    values = np.asarray(values, dtype=np.float64)
+
+    if length == 16:
+        return values.astype(np.float16).view(np.uint16).astype(np.int64)
+    elif length == 32:
+        return values.astype(np.float32).view(np.uint32).astype(np.int64)
+    else:
+        return values.view(np.uint64)
+
+
+def _encode_node(node,
+                 columns,
+                 rows,
+                 little,
+                 big,
+                 paddings,
+                 scaling,
+                 strict,
+                 check_ranges):
+    plan = node['encode_plan']
+
+    if plan.number_of_bits > 8 * plan.number_of_bytes:
+        raise EncodeError(
+            'pack requires at least {} bits to pack (got {})'.format(
+                plan.number_of_bits,
+                8 * plan.number_of_bytes))
+
+    if paddings is not None:
+        paddings[rows] &= np.frombuffer(int_to_bytes(plan.padding_mask,
+                                                     plan.number_of_bytes,
+                                                     'big'),
+                                        dtype=np.uint8)
+
+    numbers = {}
+
+    for (field,
+         name,
+         is_big_endian,
+         shift,
+         mask,
+         minimum,
+         maximum,
+         convert,
+         fmt,
+         scale,
+         offset,
+         scaling_type) in plan.items:
+        if strict and name not in columns:
+            raise EncodeError(
+                "Expected signal value for '{}' in data, but got {}.".format(
+                    name,
+                    sorted(columns)))
+
+        values, is_choice = _column_to_numbers(field, columns[name][rows])
+        numbers[name] = values
+
+        if strict and scaling:
+            if is_choice is None:
+                scaled = values
+            else:
+                scaled = values[~is_choice].astype(np.float64)
+
+            for limit, compare in [(field.minimum, np.less),
+                                   (field.maximum, np.greater)]:
+                if limit is None:
+                    continue
+
+                bad = compare(scaled, limit)
+
+                if bad.any():
+                    check_ranges([field], {name: scaled[bad][0]})
+
+        if scaling:
+            if is_choice is None:
+                if convert is not None:
+                    raws = (values - offset) / scale
+                else:
+                    raws = _scale_to_integral_batch(values,
+                                                    scale,
+                                                    offset,
+                                                    scaling_type)
+            else:
+                raws = values.copy()
+                scaled = values[~is_choice]
+
+                if convert is not None:
+                    raws[~is_choice] = (scaled.astype(np.float64) - offset) / scale
+                else:
+                    raws[~is_choice] = _scale_to_integral_batch(
+                        scaled.astype(np.float64),
+                        scale,
+                        offset,
+                        scaling_type)
+        else:
+            raws = values
+
+        if convert is not None:
+            raws = _float_to_raw(raws, mask.bit_length())
+        else:
+            raws = _raw_to_array(raws, minimum, maximum, fmt)
+
+        if is_big_endian:
+            _insert(big, rows, raws, shift, mask.bit_length())
+        else:
+            _insert(little, rows, raws, shift, mask.bit_length())
+
+    for signal, multiplexers in node['multiplexers'].items():
+        mux = numbers[signal]
+        matched = np.zeros(len(rows), dtype=bool)
+
+        for multiplexer_id, child in multiplexers.items():
+            selected = (mux == multiplexer_id)
+
+            if not selected.any():
+                continue
+
+            matched |= selected
+            _encode_node(child,
+                         columns,
+                         rows[selected],
+                         little,
+                         big,
+                         paddings,
+                         scaling,
+                         strict,
+                         check_ranges)
+
+        if not matched.all():
+            raise EncodeError('expected multiplexer id {}, but got {}'.format(
+                format_or(multiplexers),
+                mux[~matched][0]))
+
+
+def encode_batch(codecs,
+                 columns,
+                 number_of_bytes,
+                 scaling,
+                 padding,
+                 strict,
+                 check_ranges):
+    """Encode given columns of signal values using given codec tree of
+    encode plans. If `strict` is ``True``, `check_ranges` is called
+    with a signal and its first out of range value to raise an
+    error.
+
+    """
+
+    columns = {
+        name: _column_to_array(values)
+        for name, values in columns.items()
+    }
+    lengths = set([len(values) for values in columns.values()])
+
+    if len(lengths) > 1:
+        raise EncodeError(
+            'expected columns of equal length, but got {}'.format(
+                format_and(sorted(lengths))))
+
+    number_of_frames = lengths.pop() if lengths else 0
+    little = np.zeros((number_of_frames, number_of_bytes), dtype=np.uint8)
+    big = np.zeros((number_of_frames, number_of_bytes), dtype=np.uint8)
+
+    if padding:
+        paddings = np.full((number_of_frames, number_of_bytes),
+                           0xff,
+                           dtype=np.uint8)
+    else:
+        paddings = None
+
+    _encode_node(codecs,
+                 columns,
+                 np.arange(number_of_frames),
+                 little,
+                 big,
+                 paddings,
+                 scaling,
+                 strict,
+                 check_ranges)
+
+    frames = (little | big[:, ::-1])
+
+    if paddings is not None:
+        frames |= paddings
+
+    return frames
@@ -5,6 +5,7 @@ from .formats import dbc
 from .formats import kcd
 from .formats import sym
 from .internal_database import InternalDatabase
+from .dispatcher import Dispatcher
 from ...compat import fopen
 
 
@@ -46,6 +47,7 @@ class Database(object):
 
         self._frame_id_mask = frame_id_mask
         self._strict = strict
+        self._dispatcher = Dispatcher(frame_id_mask)
         self.refresh()
 
     @property
@@ -76,6 +78,19 @@ class Database(object):
 
         return self._buses
 
+    @property
+    def dispatcher(self):
+        """A :class:`~cantools.database.can.dispatcher.Dispatcher` finding
+        messages by frame id without raising exceptions for unknown
+        frame ids.
+
+        >>> db.dispatcher.lookup(0x1f0, False)
+        message('ExampleMessage', 0x1f0, False, 8, None)
+
+        """
+
+        return self._dispatcher
+
     @property
     def version(self):
         """The database version, or ``None`` if unavailable.
@@ -270,6 +285,7 @@ class Database(object):
 
         self._name_to_message[message.name] = message
         self._frame_id_to_message[masked_frame_id] = message
+        self._dispatcher.add_message(message)
 
     def as_dbc_string(self):
         """Return the database as a string formatted as a DBC file.
@@ -388,6 +404,61 @@ class Database(object):
 
         return message.decode(data, decode_choices, scaling)
 
+    def decode_batch(self,
+                     frame_ids,
+                     frames,
+                     decode_choices=True,
+                     scaling=True):
+        """Decode given frames with given frame ids `frame_ids`. Frames
+        are grouped by message using
+        :meth:`.get_message_by_frame_id()` and decoded with
+        :meth:`Message.decode_batch()<.Message.decode_batch()>`. Frames
+        with unknown frame ids are ignored.
+
+        Returns a dictionary of message name to a tuple of the indices
+        of the message's frames in `frames` and its decoded signals.
+
+        This method requires NumPy.
+
+        >>> decoded = db.decode_batch([158, 159, 158], frames)
+        >>> decoded['Foo']
+        (array([0, 2]), {'Bar': array([1, 2]), 'Fum': array([5., 5.])})
+
+        """
+
+        import numpy as np
+
+        frame_ids = np.asarray(frame_ids)
+        unique_frame_ids, inverse = np.unique(frame_ids, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        message_indices = {}
+
+        for i, frame_id in enumerate(unique_frame_ids):
+            try:
+                message = self.get_message_by_frame_id(int(frame_id))
+            except KeyError:
+                continue
+
+            message_indices.setdefault(message.name, (message, []))
+            message_indices[message.name][1].append(i)
+
+        decoded = {}
+
+        for name, (message, unique_indices) in message_indices.items():
+            indices = np.flatnonzero(np.isin(inverse, unique_indices))
+
+            if isinstance(frames, np.ndarray):
+                message_frames = frames[indices]
+            else:
+                message_frames = [frames[index] for index in indices]
+
+            decoded[name] = (indices,
+                             message.decode_batch(message_frames,
+                                                  decode_choices,
+                                                  scaling))
+
+        return decoded
+
     def refresh(self):
         """Refresh the internal database state.
 
@@ -399,6 +470,7 @@ class Database(object):
 
         self._name_to_message = {}
         self._frame_id_to_message = {}
+        self._dispatcher = Dispatcher(self._frame_id_mask)
 
         for message in self._messages:
             message.refresh(self._strict)
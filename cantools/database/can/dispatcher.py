@@ -0,0 +1,117 @@
+# Frame id to message dispatching.
+
+from collections import OrderedDict
+
+
+# Default maximum number of frame ids in the negative cache.
+NEGATIVE_CACHE_SIZE = 1024
+
+
+class Dispatcher(object):
+    """Finds messages by frame id without raising exceptions for unknown
+    frame ids. Created by
+    :meth:`Database.refresh()<.Database.refresh()>`, and available as
+    :attr:`Database.dispatcher<.Database.dispatcher>`.
+
+    Standard and extended frame ids are kept in separate tables. Frame
+    ids are masked with the database frame id mask before lookup.
+
+    Unknown frame ids are counted. The most recently missed frame ids
+    and their miss counts are kept in a negative cache of at most
+    `negative_cache_size` entries.
+
+    """
+
+    def __init__(self,
+                 frame_id_mask=0xffffffff,
+                 negative_cache_size=NEGATIVE_CACHE_SIZE):
+        self._frame_id_mask = frame_id_mask
+        self._negative_cache_size = negative_cache_size
+        self._any = {}
+        self._standard = {}
+        self._extended = {}
+        self._negative_cache = OrderedDict()
+        self._misses = 0
+
+    @property
+    def misses(self):
+        """The number of lookups of unknown frame ids.
+
+        """
+
+        return self._misses
+
+    @property
+    def unknown_frame_ids(self):
+        """A dictionary of ``(frame_id, is_extended_frame)`` to number of
+        misses of recently missed frame ids.
+
+        """
+
+        return dict(self._negative_cache)
+
+    def add_message(self, message):
+        """Add given message `message`. Replaces any message with the same
+        masked frame id.
+
+        """
+
+        masked_frame_id = (message.frame_id & self._frame_id_mask)
+        self._any[masked_frame_id] = message
+
+        if message.is_extended_frame:
+            self._extended[masked_frame_id] = message
+        else:
+            self._standard[masked_frame_id] = message
+
+        self._negative_cache.clear()
+
+    def lookup(self, frame_id, is_extended_frame=None):
+        """Returns the message with given frame id `frame_id`, or ``None`` if
+        there is no such message.
+
+        `is_extended_frame` selects the standard or extended frame id
+        table. Give it as ``None`` to look in both tables, as
+        :meth:`Database.get_message_by_frame_id()<.Database.get_message_by_frame_id()>`.
+
+        >>> db.dispatcher.lookup(0x1f0, False)
+        message('ExampleMessage', 0x1f0, False, 8, None)
+        >>> db.dispatcher.lookup(0x1f0, True) is None
+        True
+
+        """
+
+        if is_extended_frame is None:
+            table = self._any
+        elif is_extended_frame:
+            table = self._extended
+        else:
+            table = self._standard
+
+        message = table.get(frame_id & self._frame_id_mask)
+
+        if message is None:
+            self._miss(frame_id, is_extended_frame)
+
+        return message
+
+    def _miss(self, frame_id, is_extended_frame):
+        self._misses += 1
+        key = (frame_id, is_extended_frame)
+        negative_cache = self._negative_cache
+
+        try:
+            negative_cache[key] = negative_cache.pop(key) + 1
+        except KeyError:
+            negative_cache[key] = 1
+
+            if len(negative_cache) > self._negative_cache_size:
+                negative_cache.popitem(last=False)
+
+    def reset_statistics(self):
+        """Reset the miss counter and clear the negative cache.
+
+        """
+
+        self._misses = 0
+        self._negative_cache.clear()
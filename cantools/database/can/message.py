@@ -1,13 +1,14 @@
 # A CAN message.
 
-import binascii
 from copy import deepcopy
 
 from ..utils import format_or
 from ..utils import start_bit
-from ..utils import encode_data
-from ..utils import decode_data
-from ..utils import create_encode_decode_formats
+from ..utils import encode_data_with_plan
+from ..utils import decode_data_with_plan
+from ..utils import pack_encoded
+from ..utils import create_encode_plan
+from ..utils import create_decode_plan
 from ..errors import Error
 from ..errors import EncodeError
 from ..errors import DecodeError
@@ -106,8 +107,8 @@ class Message(object):
 
         return {
             'signals': signals,
-            'formats': create_encode_decode_formats(signals,
-                                                    self._length),
+            'encode_plan': create_encode_plan(signals, self._length),
+            'decode_plan': create_decode_plan(signals, self._length),
             'multiplexers': multiplexers
         }
 
@@ -677,11 +678,10 @@ class Message(object):
         if strict:
             self._check_signals(node['signals'], data, scaling)
 
-        encoded = encode_data(data,
-                              node['signals'],
-                              node['formats'],
-                              scaling)
-        padding_mask = node['formats'].padding_mask
+        big, little = encode_data_with_plan(data,
+                                            node['encode_plan'],
+                                            scaling)
+        padding_mask = node['encode_plan'].padding_mask
         multiplexers = node['multiplexers']
 
         for signal in multiplexers:
@@ -694,14 +694,15 @@ class Message(object):
                     format_or(multiplexers[signal]),
                     mux))
 
-            mux_encoded, mux_padding_mask = self._encode(node,
-                                                         data,
-                                                         scaling,
-                                                         strict)
-            encoded |= mux_encoded
+            mux_big, mux_little, mux_padding_mask = self._encode(node,
+                                                                 data,
+                                                                 scaling,
+                                                                 strict)
+            big |= mux_big
+            little |= mux_little
             padding_mask &= mux_padding_mask
 
-        return encoded, padding_mask
+        return big, little, padding_mask
 
     def encode(self, data, scaling=True, padding=False, strict=True):
         """Encode given data as a message of this type.
@@ -719,25 +720,55 @@ class Message(object):
 
         """
 
-        encoded, padding_mask = self._encode(self._codecs,
-                                             data,
-                                             scaling,
-                                             strict)
+        big, little, padding_mask = self._encode(self._codecs,
+                                                 data,
+                                                 scaling,
+                                                 strict)
 
         if padding:
-            encoded |= padding_mask
+            big |= padding_mask
 
-        encoded |= (0x80 << (8 * self._length))
-        encoded = hex(encoded)[4:].rstrip('L')
+        return pack_encoded(big, little, self._length)
 
-        return binascii.unhexlify(encoded)[:self._length]
+    def encode_batch(self, columns, scaling=True, padding=False, strict=True):
+        """Encode given columns of signal values as messages of this
+        type. `columns` is a dictionary of signal name to array-like
+        entries, with one element per frame. Returns an (N, length)
+        uint8 NumPy array. This is much faster than calling
+        :meth:`.encode()` for each frame.
+
+        Multiplexed signals are only read for frames where their
+        multiplexer selects them, so their values in other frames may
+        be anything, for example NaN.
+
+        See :meth:`.encode()` for descriptions of `scaling`, `padding`
+        and `strict`.
+
+        This method requires NumPy.
+
+        >>> foo = db.get_message_by_name('Foo')
+        >>> foo.encode_batch({'Bar': [1, 2], 'Fum': [5.0, 5.0]})
+        array([[ 1, 69, 35,  0, 17],
+               [ 2, 69, 35,  0, 17]], dtype=uint8)
+
+        """
+
+        # Import when used as NumPy is an optional dependency.
+        from ..batch import encode_batch
+
+        return encode_batch(self._codecs,
+                            columns,
+                            self._length,
+                            scaling,
+                            padding,
+                            strict,
+                            self._check_signals_ranges_scaling)
 
     def _decode(self, node, data, decode_choices, scaling):
-        decoded = decode_data(data,
-                              node['signals'],
-                              node['formats'],
-                              decode_choices,
-                              scaling)
+        decoded = decode_data_with_plan(data,
+                                        node['decode_plan'],
+                                        decode_choices,
+                                        scaling)
 
         multiplexers = node['multiplexers']
 
@@ -776,6 +807,41 @@ class Message(object):
 
         return self._decode(self._codecs, data, decode_choices, scaling)
 
+    def decode_batch(self, frames, decode_choices=True, scaling=True):
+        """Decode given frames as messages of this type. Returns a
+        dictionary of signal name to NumPy array entries, with one
+        element per frame. This is much faster than calling
+        :meth:`.decode()` for each frame.
+
+        `frames` is either an (N, length) uint8 NumPy array, or a
+        sequence of bytes-like objects.
+
+        Signals not present in a frame, because of multiplexing, are
+        decoded as NaN.
+
+        If `decode_choices` is ``False`` scaled values are not
+        converted to choice strings (if available).
+
+        If `scaling` is ``False`` no scaling of signals is performed.
+
+        This method requires NumPy.
+
+        >>> foo = db.get_message_by_name('Foo')
+        >>> foo.decode_batch([b'\\x01\\x45\\x23\\x00\\x11',
+        ...                   b'\\x02\\x45\\x23\\x00\\x11'])
+        {'Bar': array([1, 2]), 'Fum': array([5., 5.])}
+
+        """
+
+        # Import when used as NumPy is an optional dependency.
+        from ..batch import decode_batch
+
+        return decode_batch(self._codecs,
+                            frames,
+                            self._length,
+                            decode_choices,
+                            scaling)
+
     def get_signal_by_name(self, name):
         for signal in self._signals:
             if signal.name == name:
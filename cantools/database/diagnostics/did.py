@@ -1,10 +1,10 @@
 # A DID.
 
-import binascii
-
-from ..utils import encode_data
-from ..utils import decode_data
-from ..utils import create_encode_decode_formats
+from ..utils import encode_data_with_plan
+from ..utils import decode_data_with_plan
+from ..utils import pack_encoded
+from ..utils import create_encode_plan
+from ..utils import create_decode_plan
 
 
 class Did(object):
@@ -90,14 +90,11 @@ class Did(object):
 
         """
 
-        encoded = encode_data(data,
-                              self._codec['datas'],
-                              self._codec['formats'],
-                              scaling)
-        encoded |= (0x80 << (8 * self._length))
-        encoded = hex(encoded)[4:].rstrip('L')
+        big, little = encode_data_with_plan(data,
+                                            self._codec['encode_plan'],
+                                            scaling)
 
-        return binascii.unhexlify(encoded)[:self._length]
+        return pack_encoded(big, little, self._length)
 
     def decode(self, data, decode_choices=True, scaling=True):
         """Decode given data as a DID of this type.
@@ -113,11 +110,10 @@ class Did(object):
 
         """
 
-        return decode_data(data[:self._length],
-                           self._codec['datas'],
-                           self._codec['formats'],
-                           decode_choices,
-                           scaling)
+        return decode_data_with_plan(data[:self._length],
+                                     self._codec['decode_plan'],
+                                     decode_choices,
+                                     scaling)
 
     def refresh(self):
         """Refresh the internal DID state.
@@ -126,8 +122,8 @@ class Did(object):
 
         self._codec = {
             'datas': self._datas,
-            'formats': create_encode_decode_formats(self._datas,
-                                                    self._length)
+            'encode_plan': create_encode_plan(self._datas, self._length),
+            'decode_plan': create_decode_plan(self._datas, self._length)
         }
 
     def __repr__(self):
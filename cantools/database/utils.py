@@ -1,10 +1,18 @@
 # Utility functions.
 
+from __future__ import division
 import binascii
+import math
+import struct
 from decimal import Decimal
 from collections import namedtuple
 import bitstruct
 
+from ..compat import int_from_bytes
+from ..compat import int_to_bytes
+from .errors import EncodeError
+from .errors import DecodeError
+
 
 Formats = namedtuple('Formats',
                      [
@@ -14,6 +22,45 @@ Formats = namedtuple('Formats',
                      ])
 
 
+DecodePlan = namedtuple('DecodePlan',
+                        [
+                            'number_of_bits',
+                            'big_endian',
+                            'little_endian',
+                            'items'
+                        ])
+
+
+EncodePlan = namedtuple('EncodePlan',
+                        [
+                            'number_of_bytes',
+                            'number_of_bits',
+                            'padding_mask',
+                            'items'
+                        ])
+
+
+# Integers in this range are exactly representable as floats.
+MAXIMUM_EXACT_FLOAT_INTEGER = 2 ** 53
+
+# Integers in this range minus any offset are exactly representable
+# with the default decimal.Decimal precision of 28 digits.
+MAXIMUM_DECIMAL_INTEGER = 10 ** 27
+
+# Relative error bound of a scaled value calculated with floats,
+# with a good safety margin. Values closer than this to a rounding
+# boundary are scaled using decimal.Decimal instead.
+SCALING_ROUNDING_MARGIN = 2 ** -48
+
+# Struct formats used to reinterpret raw bits as a float, by float
+# length in bits.
+FLOAT_FORMATS = {
+    16: ('>H', '>e'),
+    32: ('>I', '>f'),
+    64: ('>Q', '>d')
+}
+
+
 def format_or(items):
     items = [str(item) for item in items]
 
@@ -99,6 +146,334 @@ def decode_data(data, fields, formats, decode_choices, scaling):
     }
 
 
+def _create_float_converter(length):
+    raw_format, float_format = FLOAT_FORMATS[length]
+    pack = struct.Struct(raw_format).pack
+    unpack = struct.Struct(float_format).unpack
+
+    def convert(value):
+        return unpack(pack(value))[0]
+
+    return convert
+
+
+def create_decode_plan(datas, number_of_bytes):
+    """Create a decode plan for given datas in a message or DID of given
+    length. Each data is decoded from an integer of the whole frame
+    with a precomputed shift and mask, instead of unpacking the frame
+    with bitstruct.
+
+    """
+
+    format_length = (8 * number_of_bytes)
+    number_of_bits = format_length
+    big_endian = False
+    little_endian = False
+    items = []
+
+    for data in datas:
+        if data.byte_order == 'big_endian':
+            is_big_endian = True
+            big_endian = True
+            end = (start_bit(data) + data.length)
+            shift = (format_length - end)
+        else:
+            is_big_endian = False
+            little_endian = True
+            end = (data.start + data.length)
+            shift = data.start
+
+        # Datas that do not fit in the frame can never be decoded.
+        number_of_bits = max(number_of_bits, end)
+
+        mask = ((1 << data.length) - 1)
+
+        if data.is_float:
+            sign_bit = 0
+            convert = _create_float_converter(data.length)
+        else:
+            sign_bit = (1 << (data.length - 1)) if data.is_signed else 0
+            convert = None
+
+        items.append((data.name,
+                      is_big_endian,
+                      shift,
+                      mask,
+                      sign_bit,
+                      convert,
+                      data.scale,
+                      data.offset,
+                      data.choices))
+
+    return DecodePlan(number_of_bits, big_endian, little_endian, items)
+
+
+def decode_data_with_plan(data, plan, decode_choices, scaling):
+    """Decode given data using given decode plan, created by
+    :func:`create_decode_plan()`.
+
+    """
+
+    if 8 * len(data) < plan.number_of_bits:
+        raise DecodeError(
+            'unpack requires at least {} bits to unpack (got {})'.format(
+                plan.number_of_bits,
+                8 * len(data)))
+
+    if plan.big_endian:
+        big = int_from_bytes(data, 'big')
+    else:
+        big = 0
+
+    if plan.little_endian:
+        little = int_from_bytes(data, 'little')
+    else:
+        little = 0
+
+    decoded = {}
+
+    for (name,
+         is_big_endian,
+         shift,
+         mask,
+         sign_bit,
+         convert,
+         scale,
+         offset,
+         choices) in plan.items:
+        if is_big_endian:
+            value = ((big >> shift) & mask)
+        else:
+            value = ((little >> shift) & mask)
+
+        if convert is not None:
+            value = convert(value)
+        elif value & sign_bit:
+            value -= (mask + 1)
+
+        if decode_choices and choices is not None:
+            try:
+                decoded[name] = choices[value]
+                continue
+            except KeyError:
+                pass
+
+        if scaling:
+            value = (scale * value + offset)
+
+        decoded[name] = value
+
+    return decoded
+
+
+def _create_float_packer(length):
+    raw_format, float_format = FLOAT_FORMATS[length]
+    pack = struct.Struct(float_format).pack
+    unpack = struct.Struct(raw_format).unpack
+
+    def convert(value):
+        return unpack(pack(float(value)))[0]
+
+    return convert
+
+
+def _is_exact_float(value):
+    if isinstance(value, float):
+        return True
+    elif isinstance(value, int) and not isinstance(value, bool):
+        return abs(value) <= MAXIMUM_EXACT_FLOAT_INTEGER
+    else:
+        return False
+
+
+def scale_to_integral(value, scale, offset):
+    """Returns given value scaled and rounded to an integer exactly as
+    ``((Decimal(value) - Decimal(offset)) / Decimal(scale)).to_integral()``
+    would, but using floats whenever the result is unambiguous.
+
+    """
+
+    if _is_exact_float(value):
+        quotient = (value - offset) / scale
+        integral = math.floor(quotient)
+        fraction = (quotient - integral)
+
+        if abs(fraction - 0.5) > SCALING_ROUNDING_MARGIN * abs(quotient):
+            if fraction > 0.5:
+                integral += 1
+
+            return int(integral)
+
+    value = (Decimal(value) - Decimal(offset)) / Decimal(scale)
+
+    return value.to_integral()
+
+
+def create_encode_plan(datas, number_of_bytes):
+    """Create an encode plan for given datas in a message or DID of given
+    length. Each data is scaled, range checked and shifted into
+    an integer of the whole frame, instead of packing it with
+    bitstruct.
+
+    """
+
+    format_length = (8 * number_of_bytes)
+    number_of_bits = format_length
+    used_big_endian = 0
+    used_little_endian = 0
+    items = []
+
+    for data in datas:
+        if data.byte_order == 'big_endian':
+            is_big_endian = True
+            end = (start_bit(data) + data.length)
+            shift = (format_length - end)
+        else:
+            is_big_endian = False
+            end = (data.start + data.length)
+            shift = data.start
+
+        mask = ((1 << data.length) - 1)
+
+        if data.is_float:
+            minimum = None
+            maximum = None
+            convert = _create_float_packer(data.length)
+            type_ = 'f'
+        elif data.is_signed:
+            minimum = -(1 << (data.length - 1))
+            maximum = -minimum - 1
+            convert = None
+            type_ = 's'
+        else:
+            minimum = 0
+            maximum = mask
+            convert = None
+            type_ = 'u'
+
+        # Datas that do not fit in the frame can never be encoded.
+        if end > format_length:
+            number_of_bits = max(number_of_bits, end)
+        elif is_big_endian:
+            used_big_endian |= (mask << shift)
+        else:
+            used_little_endian |= (mask << shift)
+
+        if not _is_exact_float(data.scale) or not _is_exact_float(data.offset):
+            scaling = 'decimal'
+        elif (data.scale == 1
+              and isinstance(data.scale, int)
+              and isinstance(data.offset, int)):
+            scaling = 'integer'
+        else:
+            scaling = 'float'
+
+        items.append((data,
+                      data.name,
+                      is_big_endian,
+                      shift,
+                      mask,
+                      minimum,
+                      maximum,
+                      convert,
+                      '{}{}'.format(type_, data.length),
+                      data.scale,
+                      data.offset,
+                      scaling))
+
+    used = used_big_endian
+
+    if used_little_endian:
+        used |= int_from_bytes(int_to_bytes(used_little_endian,
+                                            number_of_bytes,
+                                            'little'),
+                               'big')
+
+    padding_mask = (((1 << format_length) - 1) & ~used)
+
+    return EncodePlan(number_of_bytes, number_of_bits, padding_mask, items)
+
+
+def encode_data_with_plan(data, plan, scaling):
+    """Encode given data using given encode plan, created by
+    :func:`create_encode_plan()`. Returns the big endian and little
+    endian datas as two integers, which are merged by
+    :func:`pack_encoded()`.
+
+    """
+
+    if plan.number_of_bits > 8 * plan.number_of_bytes:
+        raise EncodeError(
+            'pack requires at least {} bits to pack (got {})'.format(
+                plan.number_of_bits,
+                8 * plan.number_of_bytes))
+
+    big = 0
+    little = 0
+
+    for (field,
+         name,
+         is_big_endian,
+         shift,
+         mask,
+         minimum,
+         maximum,
+         convert,
+         fmt,
+         scale,
+         offset,
+         scaling_type) in plan.items:
+        value = data[name]
+
+        if isinstance(value, str):
+            value = field.choice_string_to_number(value)
+        elif scaling:
+            if convert is not None:
+                value = (value - offset) / scale
+            elif (scaling_type == 'integer'
+                  and isinstance(value, int)
+                  and -MAXIMUM_DECIMAL_INTEGER < value < MAXIMUM_DECIMAL_INTEGER):
+                value -= offset
+            elif scaling_type != 'decimal':
+                value = scale_to_integral(value, scale, offset)
+            else:
+                value = (Decimal(value) - Decimal(offset)) / Decimal(scale)
+                value = value.to_integral()
+
+        if convert is not None:
+            raw = convert(value)
+        else:
+            raw = int(value)
+
+            if raw < minimum or raw > maximum:
+                raise EncodeError(
+                    '"{}" requires {} <= integer <= {} (got {})'.format(
+                        fmt,
+                        minimum,
+                        maximum,
+                        value))
+
+        if is_big_endian:
+            big |= ((raw & mask) << shift)
+        else:
+            little |= ((raw & mask) << shift)
+
+    return big, little
+
+
+def pack_encoded(big, little, number_of_bytes):
+    """Merge big and little endian datas returned by
+    :func:`encode_data_with_plan()` and return them as bytes.
+
+    """
+
+    if little:
+        big |= int_from_bytes(int_to_bytes(little, number_of_bytes, 'little'),
+                              'big')
+
+    return int_to_bytes(big, number_of_bytes, 'big')
+
+
 def create_encode_decode_formats(datas, number_of_bytes):
     format_length = (8 * number_of_bytes)
 
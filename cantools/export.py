@@ -0,0 +1,317 @@
+# Export of decoded log files to per message tables.
+
+import os
+
+from .errors import Error
+
+
+# Default number of rows buffered per message before they are written
+# to the output file.
+ROW_GROUP_SIZE = 65536
+
+# Number of bytes copied at a time when an .npz file is created.
+COPY_SIZE = 1024 * 1024
+
+
+def _signal_dtype(signal, decode_choices, scaling):
+    """Returns the NumPy data type and the value of absent multiplexed
+    signals of given signal's column.
+
+    """
+
+    import numpy as np
+
+    if decode_choices and signal.choices:
+        width = max([len(str(choice)) for choice in signal.choices.values()])
+
+        # Values without a choice are stored as numbers.
+        return np.dtype('U{}'.format(max(width, 24))), ''
+
+    if signal.multiplexer_ids is not None or signal.is_float:
+        return np.dtype(np.float64), np.nan
+
+    if scaling and not (isinstance(signal.scale, int)
+                        and isinstance(signal.offset, int)):
+        return np.dtype(np.float64), np.nan
+
+    if signal.length > 64:
+        return np.dtype(np.float64), np.nan
+
+    if signal.length == 64 and not signal.is_signed:
+        return np.dtype(np.uint64), 0
+
+    return np.dtype(np.int64), 0
+
+
+class _NpzWriter(object):
+    """Writes row groups to an uncompressed ``.npz`` file with one
+    ``.npy`` member per column. Row groups are spooled to a temporary
+    file, which is converted to the ``.npz`` file when closed.
+
+    """
+
+    extension = '.npz'
+
+    def __init__(self, filename, names, dtypes):
+        self._filename = filename
+        self._spool_filename = filename + '.spool'
+        self._names = names
+        self._dtypes = dtypes
+        self._row_groups = []
+        self._offset = 0
+
+        with open(self._spool_filename, 'wb'):
+            pass
+
+    def write(self, columns, rows):
+        with open(self._spool_filename, 'ab') as fout:
+            for column in columns:
+                fout.write(column[:rows].tobytes())
+
+        self._row_groups.append((self._offset, rows))
+        self._offset += rows * sum([dtype.itemsize for dtype in self._dtypes])
+
+    def close(self):
+        import zipfile
+        import numpy as np
+
+        number_of_rows = sum([rows for _, rows in self._row_groups])
+
+        with open(self._spool_filename, 'rb') as fin:
+            with zipfile.ZipFile(self._filename, 'w', allowZip64=True) as fzip:
+                column_offset = 0
+
+                for name, dtype in zip(self._names, self._dtypes):
+                    with fzip.open(name + '.npy', 'w', force_zip64=True) as fout:
+                        np.lib.format.write_array_header_1_0(
+                            fout,
+                            {
+                                'descr': np.lib.format.dtype_to_descr(dtype),
+                                'fortran_order': False,
+                                'shape': (number_of_rows, )
+                            })
+
+                        for offset, rows in self._row_groups:
+                            fin.seek(offset + rows * column_offset)
+                            self._copy(fin, fout, rows * dtype.itemsize)
+
+                    column_offset += dtype.itemsize
+
+        os.remove(self._spool_filename)
+
+    @staticmethod
+    def _copy(fin, fout, size):
+        while size > 0:
+            data = fin.read(min(size, COPY_SIZE))
+            fout.write(data)
+            size -= len(data)
+
+
+class _ParquetWriter(object):
+    """Writes each row group as a Parquet row group.
+
+    """
+
+    extension = '.parquet'
+
+    def __init__(self, filename, names, dtypes):
+        # Import when used as pyarrow is an optional dependency.
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise Error('the parquet output format requires pyarrow')
+
+        self._pa = pyarrow
+        self._filename = filename
+        self._names = names
+        self._dtypes = dtypes
+        self._writer = None
+
+    def write(self, columns, rows):
+        arrays = []
+
+        for column, dtype in zip(columns, self._dtypes):
+            column = column[:rows]
+
+            if dtype.kind == 'U':
+                arrays.append(self._pa.array(column,
+                                             mask=(column == ''),
+                                             type=self._pa.string()))
+            else:
+                arrays.append(self._pa.array(column, from_pandas=True))
+
+        table = self._pa.Table.from_arrays(arrays, names=self._names)
+
+        if self._writer is None:
+            self._writer = self._pa.parquet.ParquetWriter(self._filename,
+                                                          table.schema)
+
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+WRITERS = {
+    'npz': _NpzWriter,
+    'parquet': _ParquetWriter
+}
+
+
+class _Table(object):
+    """A table of decoded signals of a message, with a timestamp column
+    and one column per signal. Rows are accumulated in preallocated
+    arrays and written a row group at a time.
+
+    """
+
+    def __init__(self,
+                 message,
+                 writer,
+                 filename,
+                 row_group_size,
+                 decode_choices,
+                 scaling):
+        import numpy as np
+
+        self.filename = filename
+        self.number_of_rows = 0
+        self._row_group_size = row_group_size
+        self._row = 0
+        names = ['timestamp']
+        dtypes = [np.dtype(np.float64)]
+        self._signals = []
+
+        for signal in message.signals:
+            dtype, absent = _signal_dtype(signal, decode_choices, scaling)
+            names.append(signal.name)
+            dtypes.append(dtype)
+            self._signals.append((signal.name,
+                                  np.empty(row_group_size, dtype),
+                                  absent))
+
+        self._timestamps = np.empty(row_group_size, np.float64)
+        self._columns = [self._timestamps]
+        self._columns += [column for _, column, _ in self._signals]
+        self._writer = writer(filename, names, dtypes)
+
+    def append(self, timestamp, signals):
+        row = self._row
+        self._timestamps[row] = timestamp
+
+        for name, column, absent in self._signals:
+            column[row] = signals.get(name, absent)
+
+        row += 1
+
+        if row == self._row_group_size:
+            self._writer.write(self._columns, row)
+            row = 0
+
+        self._row = row
+        self.number_of_rows += 1
+
+    def close(self):
+        if self._row > 0:
+            self._writer.write(self._columns, self._row)
+            self._row = 0
+
+        self._writer.close()
+
+
+def export_frames(database,
+                  frames,
+                  directory,
+                  output_format='npz',
+                  row_group_size=ROW_GROUP_SIZE,
+                  decode_choices=False,
+                  scaling=True):
+    """Decode given frames `frames` using given database `database` and
+    write one table per message to given directory `directory`.
+    `frames` is an iterable of :class:`~cantools.logreader.Frame`
+    objects, typically a generator returned by one of the read
+    functions in :mod:`cantools.logreader`.
+
+    Each table has a ``timestamp`` column and one column per signal in
+    the message. Multiplexed signals are NaN, or null in Parquet, in
+    rows where they are not present. Frames with unknown frame ids and
+    frames that cannot be decoded are skipped.
+
+    `output_format` is ``'npz'`` or ``'parquet'``. ``'npz'`` writes
+    an uncompressed ``<message name>.npz`` file per message, readable
+    with ``numpy.load()``. ``'parquet'`` writes a ``<message
+    name>.parquet`` file per message and requires pyarrow.
+
+    Rows are buffered per message and written `row_group_size` rows
+    at a time, so the memory use does not depend on the number of
+    frames.
+
+    If `decode_choices` is ``True`` signals with choices are exported
+    as strings. If `scaling` is ``False`` no scaling of signals is
+    performed.
+
+    Returns a dictionary of message name to a tuple of the number of
+    rows and the table filename.
+
+    This function requires NumPy.
+
+    >>> with open('candump.log') as fin:
+    ...     export_frames(db, cantools.logreader.read_candump(fin), 'out')
+    {'ExampleMessage': (1000, 'out/ExampleMessage.npz')}
+
+    """
+
+    try:
+        writer = WRITERS[output_format]
+    except KeyError:
+        raise Error(
+            "expected output format in {}, but got '{}'".format(
+                sorted(WRITERS),
+                output_format))
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    tables = {}
+
+    try:
+        for frame in frames:
+            message = database.dispatcher.lookup(frame.frame_id,
+                                                 frame.is_extended_frame)
+
+            if message is None:
+                continue
+
+            try:
+                signals = message.decode(frame.data, decode_choices, scaling)
+            except Exception:
+                continue
+
+            try:
+                table = tables[message.name]
+            except KeyError:
+                table = _Table(message,
+                               writer,
+                               os.path.join(directory,
+                                            message.name + writer.extension),
+                               row_group_size,
+                               decode_choices,
+                               scaling)
+                tables[message.name] = table
+
+            timestamp = frame.timestamp
+
+            if timestamp is None:
+                timestamp = float('nan')
+
+            table.append(timestamp, signals)
+    finally:
+        for table in tables.values():
+            table.close()
+
+    return {
+        name: (table.number_of_rows, table.filename)
+        for name, table in tables.items()
+    }
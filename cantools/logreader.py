@@ -0,0 +1,346 @@
+# Readers of CAN log files.
+
+import re
+import struct
+import binascii
+from collections import namedtuple
+
+from .errors import Error
+
+
+# Default number of bytes read from a log file at a time.
+CHUNK_SIZE = 1024 * 1024
+
+# Frame ids with this bit set are extended frame ids in the binary
+# format, just as in SocketCAN.
+CAN_EFF_FLAG = 0x80000000
+
+# The binary format. A file header followed by records of a
+# timestamp, a frame id and the data length, followed by the data.
+BINARY_MAGIC = b'CANTLOG1'
+BINARY_RECORD = struct.Struct('<dIB')
+
+# Matches 'candump' output, i.e. "vcan0  1F0   [8]  00 00 00 00 00 00 1B C1",
+# optionally preceded by a timestamp, i.e. "(1579857014.345944)".
+RE_CANDUMP = re.compile(r'^\s*(?:\((\d+(?:\.\d+)?)\)\s+)?\S+\s+'
+                        r'([0-9A-F]+)\s*\[\d+\]\s*([0-9A-F ]*)$')
+
+# Matches 'candump -L' output, i.e. "(1579857014.345944) vcan0 1F0#0000001BC1",
+# and CAN FD frames, i.e. "(1579857014.345944) vcan0 1F0##10000001BC1".
+RE_CANDUMP_LOG = re.compile(r'^\s*\((\d+(?:\.\d+)?)\)\s+(\S+)\s+'
+                            r'([0-9A-Fa-f]+)#(#[0-9A-Fa-f])?([0-9A-Fa-f.]*)\s*$')
+
+
+class Frame(namedtuple('Frame',
+                       [
+                           'timestamp',
+                           'frame_id',
+                           'data',
+                           'is_extended_frame',
+                           'channel'
+                       ])):
+    """A CAN frame read from a log file. `timestamp` is in seconds, or
+    ``None`` if unavailable.
+
+    """
+
+
+def _unhexlify(data):
+    return binascii.unhexlify(data.replace(' ', '').replace('.', ''))
+
+
+def parse_candump_line(line):
+    """Parse given ``candump`` output line `line`, with or without
+    ``-L``. Returns a :class:`~cantools.logreader.Frame`, or ``None``
+    if the line is not a data frame.
+
+    >>> parse_candump_line('(1.000000) vcan0 1F0#0000001BC1')
+    Frame(timestamp=1.0, frame_id=496, data=b'\\x00\\x00\\x00\\x1b\\xc1', is_extended_frame=False, channel='vcan0')
+
+    """
+
+    mo = RE_CANDUMP_LOG.match(line)
+
+    if mo:
+        frame_id = mo.group(3)
+
+        return Frame(float(mo.group(1)),
+                     int(frame_id, 16),
+                     _unhexlify(mo.group(5)),
+                     len(frame_id) > 3,
+                     mo.group(2))
+
+    mo = RE_CANDUMP.match(line)
+
+    if mo:
+        timestamp = mo.group(1)
+        frame_id = mo.group(2)
+
+        if timestamp is not None:
+            timestamp = float(timestamp)
+
+        return Frame(timestamp,
+                     int(frame_id, 16),
+                     _unhexlify(mo.group(3)),
+                     len(frame_id) > 3,
+                     None)
+
+
+def parse_asc_line(line, base=16):
+    """Parse given Vector ASC line `line`. `base` is the base of frame ids
+    and data bytes, as given by the ``base`` header. Returns a
+    :class:`~cantools.logreader.Frame`, or ``None`` if the line is not
+    a data frame.
+
+    >>> parse_asc_line('   0.015991 1  1F3             Rx   d 3 01 02 03')
+    Frame(timestamp=0.015991, frame_id=499, data=b'\\x01\\x02\\x03', is_extended_frame=False, channel='1')
+
+    """
+
+    tokens = line.split()
+
+    if len(tokens) < 6:
+        return
+
+    try:
+        timestamp = float(tokens[0])
+
+        if tokens[1] == 'CANFD':
+            # <time> CANFD <channel> <dir> <id> [<name>] <brs> <esi> <dlc>
+            # <length> <data> ...
+            channel = tokens[2]
+            frame_id = tokens[4]
+            rest = tokens[5:]
+
+            if rest[0] not in ['0', '1']:
+                rest = rest[1:]
+
+            length = int(rest[3])
+            data = rest[4:4 + length]
+        else:
+            # <time> <channel> <id> <dir> d <dlc> <data> ...
+            channel = tokens[1]
+            frame_id = tokens[2]
+
+            if tokens[4] != 'd':
+                return
+
+            length = int(tokens[5], 16)
+            data = tokens[6:6 + length]
+
+        is_extended_frame = frame_id.endswith('x')
+        frame_id = int(frame_id.rstrip('x'), base)
+        data = bytes(bytearray([int(byte, base) for byte in data]))
+    except (ValueError, IndexError):
+        return
+
+    if len(data) != length:
+        return
+
+    return Frame(timestamp, frame_id, data, is_extended_frame, channel)
+
+
+def iter_candump_lines(fp):
+    """Read lines from given ``candump`` output file object `fp`, with or
+    without ``-L``.
+
+    Returns a generator of ``(line, frame)`` tuples, where `frame` is
+    a :class:`~cantools.logreader.Frame`, or ``None`` if the line is
+    not a data frame.
+
+    """
+
+    for line in fp:
+        yield line, parse_candump_line(line)
+
+
+def iter_asc_lines(fp, base=16):
+    """Read lines from given Vector ASC file object `fp`. `base` is the
+    base of frame ids and data bytes until a ``base`` header is read.
+
+    Returns a generator of ``(line, frame)`` tuples, where `frame` is
+    a :class:`~cantools.logreader.Frame`, or ``None`` if the line is
+    not a data frame.
+
+    """
+
+    for line in fp:
+        if line.startswith('base '):
+            base = 10 if line.split()[1] == 'dec' else 16
+            frame = None
+        else:
+            frame = parse_asc_line(line, base)
+
+        yield line, frame
+
+
+def read_candump(fp):
+    """Read frames from given ``candump`` output file object `fp`, with or
+    without ``-L``. Lines that are not data frames are skipped.
+
+    Returns a generator of :class:`~cantools.logreader.Frame` objects.
+
+    >>> with open('candump.log') as fin:
+    ...     for frame in read_candump(fin):
+    ...         print(frame.frame_id, frame.data)
+
+    """
+
+    for _, frame in iter_candump_lines(fp):
+        if frame is not None:
+            yield frame
+
+
+def read_asc(fp, base=16):
+    """Read frames from given Vector ASC file object `fp`. Lines that are
+    not data frames, for example error frames and remote frames, are
+    skipped. See :func:`~cantools.logreader.iter_asc_lines()` for a
+    description of `base`.
+
+    Returns a generator of :class:`~cantools.logreader.Frame` objects.
+
+    """
+
+    for _, frame in iter_asc_lines(fp, base):
+        if frame is not None:
+            yield frame
+
+
+def read_binary(fp, chunk_size=CHUNK_SIZE):
+    """Read frames from given binary log file object `fp`, written by
+    :func:`~cantools.logreader.write_binary()`. `fp` must be opened in
+    binary mode. The file is read `chunk_size` bytes at a time.
+
+    Returns a generator of :class:`~cantools.logreader.Frame` objects.
+
+    """
+
+    magic = fp.read(len(BINARY_MAGIC))
+
+    if magic != BINARY_MAGIC:
+        raise Error(
+            "expected binary log file magic {!r}, but got {!r}".format(
+                BINARY_MAGIC,
+                magic))
+
+    unpack_from = BINARY_RECORD.unpack_from
+    header_size = BINARY_RECORD.size
+    buf = b''
+
+    while True:
+        chunk = fp.read(chunk_size)
+
+        if not chunk:
+            break
+
+        buf += chunk
+        offset = 0
+        size = len(buf)
+
+        while offset + header_size <= size:
+            timestamp, frame_id, length = unpack_from(buf, offset)
+            end = offset + header_size + length
+
+            if end > size:
+                break
+
+            yield Frame(timestamp,
+                        frame_id & ~CAN_EFF_FLAG,
+                        buf[offset + header_size:end],
+                        bool(frame_id & CAN_EFF_FLAG),
+                        None)
+            offset = end
+
+        buf = buf[offset:]
+
+    if buf:
+        raise Error(
+            'binary log file ended with a truncated record of {} '
+            'byte(s)'.format(len(buf)))
+
+
+def write_binary(fp, frames):
+    """Write given frames `frames` to given file object `fp` in the binary
+    log format read by :func:`~cantools.logreader.read_binary()`. `fp`
+    must be opened in binary mode. Frames without a timestamp are
+    written with timestamp zero.
+
+    >>> with open('foo.bin', 'wb') as fout:
+    ...     write_binary(fout, read_candump(sys.stdin))
+
+    """
+
+    pack = BINARY_RECORD.pack
+    fp.write(BINARY_MAGIC)
+
+    for frame in frames:
+        frame_id = frame.frame_id
+
+        if frame.is_extended_frame:
+            frame_id |= CAN_EFF_FLAG
+
+        fp.write(pack(frame.timestamp or 0.0, frame_id, len(frame.data)))
+        fp.write(frame.data)
+
+
+READERS = {
+    'candump': read_candump,
+    'asc': read_asc,
+    'binary': read_binary
+}
+
+LINE_ITERATORS = {
+    'candump': iter_candump_lines,
+    'asc': iter_asc_lines
+}
+
+
+def decode_stream(database,
+                  reader,
+                  decode_choices=True,
+                  scaling=True,
+                  strict=False):
+    """Decode frames from given reader `reader` using given database
+    `database`. `reader` is an iterable of
+    :class:`~cantools.logreader.Frame` objects, typically a generator
+    returned by one of the read functions in this module.
+
+    Returns a generator of ``(timestamp, message, signals)`` tuples,
+    where `message` is a :class:`~cantools.database.can.Message` and
+    `signals` a dictionary of signal name-value entries. Frames are
+    read and decoded one at a time.
+
+    Frames with frame ids not in the database and frames that cannot
+    be decoded are skipped, unless `strict` is ``True``, in which case
+    an exception is raised.
+
+    See :meth:`~cantools.database.can.Message.decode()` for
+    descriptions of `decode_choices` and `scaling`.
+
+    >>> with open('candump.log') as fin:
+    ...     for timestamp, message, signals in decode_stream(db, read_candump(fin)):
+    ...         print(timestamp, message.name, signals)
+
+    """
+
+    lookup = database.dispatcher.lookup
+
+    for frame in reader:
+        message = lookup(frame.frame_id, frame.is_extended_frame)
+
+        if message is None:
+            if strict:
+                raise Error(
+                    'unknown frame id {0} (0x{0:x})'.format(frame.frame_id))
+
+            continue
+
+        try:
+            signals = message.decode(frame.data, decode_choices, scaling)
+        except Exception:
+            if strict:
+                raise
+
+            continue
+
+        yield frame.timestamp, message, signals
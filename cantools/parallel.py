@@ -0,0 +1,264 @@
+# Parallel decoding of log files.
+
+import io
+import os
+import multiprocessing
+from collections import deque
+
+from . import database
+from . import logreader
+from .errors import Error
+from .subparsers.utils import format_message_by_frame_id
+
+
+# Default number of bytes in each chunk of a log file decoded by a
+# worker.
+CHUNK_SIZE = 16 * 1024 * 1024
+
+# The database of the worker process.
+_database = None
+
+
+def _init_worker(database_path, load_kwargs):
+    global _database
+
+    _database = database.load_file(database_path, **load_kwargs)
+
+
+def _read_chunk_lines(task):
+    """Returns the lines in the byte range of given task.
+
+    """
+
+    log_path, start, end, input_format, base = task[:5]
+
+    with open(log_path, 'rb') as fin:
+        fin.seek(start)
+        data = fin.read(end - start)
+
+    lines = io.StringIO(data.decode('utf-8', 'replace'))
+
+    if input_format == 'asc':
+        return logreader.iter_asc_lines(lines, base)
+    else:
+        return logreader.LINE_ITERATORS[input_format](lines)
+
+
+def _decode_chunk(task):
+    decode_choices, scaling = task[5:]
+    decoded = []
+    frames = (
+        frame
+        for _, frame in _read_chunk_lines(task)
+        if frame is not None
+    )
+
+    for timestamp, message, signals in logreader.decode_stream(_database,
+                                                               frames,
+                                                               decode_choices,
+                                                               scaling):
+        decoded.append((timestamp, message.name, signals))
+
+    return decoded
+
+
+def _format_chunk(task):
+    decode_choices, single_line = task[5:]
+    lines = []
+
+    for line, frame in _read_chunk_lines(task):
+        line = line.rstrip('\r\n')
+
+        if frame is not None:
+            line += ' ::'
+            line += format_message_by_frame_id(_database,
+                                               frame.frame_id,
+                                               frame.data,
+                                               decode_choices,
+                                               single_line)
+
+        lines.append(line)
+
+    return lines
+
+
+def split_file(filename, chunk_size=CHUNK_SIZE):
+    """Split given file `filename` into byte ranges of about `chunk_size`
+    bytes, each ending at a line boundary.
+
+    Returns a list of ``(start, end)`` tuples.
+
+    >>> split_file('candump.log', 1024)
+    [(0, 1038), (1038, 2080), (2080, 2551)]
+
+    """
+
+    size = os.path.getsize(filename)
+    ranges = []
+    start = 0
+
+    with open(filename, 'rb') as fin:
+        while start < size:
+            end = start + chunk_size
+
+            if end >= size:
+                end = size
+            else:
+                fin.seek(end)
+                fin.readline()
+                end = fin.tell()
+
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def _read_asc_base(filename):
+    """Returns the base given in the header of given ASC file.
+
+    """
+
+    with open(filename, 'r') as fin:
+        for line in fin:
+            if line.startswith('base '):
+                return 10 if line.split()[1] == 'dec' else 16
+
+            if logreader.parse_asc_line(line) is not None:
+                break
+
+    return 16
+
+
+def _map_ordered(pool, func, tasks, window):
+    """Like ``pool.imap(func, tasks)``, but with at most `window` tasks in
+    progress or waiting to be consumed, which bounds the memory use.
+
+    """
+
+    pending = deque()
+
+    for task in tasks:
+        pending.append(pool.apply_async(func, (task, )))
+
+        if len(pending) >= window:
+            yield pending.popleft().get()
+
+    while pending:
+        yield pending.popleft().get()
+
+
+def _run(func,
+         database_path,
+         log_path,
+         jobs,
+         input_format,
+         chunk_size,
+         load_kwargs,
+         args):
+    if input_format not in logreader.LINE_ITERATORS:
+        raise Error(
+            "parallel decoding of the {} log file format is not "
+            "supported".format(input_format))
+
+    if input_format == 'asc':
+        base = _read_asc_base(log_path)
+    else:
+        base = None
+
+    tasks = [
+        (log_path, start, end, input_format, base) + args
+        for start, end in split_file(log_path, chunk_size)
+    ]
+
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+
+    pool = multiprocessing.Pool(jobs,
+                                _init_worker,
+                                (database_path, load_kwargs))
+
+    try:
+        for result in _map_ordered(pool, func, tasks, 2 * jobs):
+            yield result
+
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def decode_file(database_path,
+                log_path,
+                jobs=None,
+                input_format='candump',
+                decode_choices=True,
+                scaling=True,
+                chunk_size=CHUNK_SIZE,
+                **kwargs):
+    """Decode given log file `log_path` using the database in given file
+    `database_path`, in `jobs` worker processes. `jobs` defaults to
+    the number of CPUs.
+
+    The log file is split into chunks of about `chunk_size` bytes
+    ending at line boundaries, which are decoded by the workers. Each
+    worker loads the database once. Give `cache_dir` to load it from
+    the database cache.
+
+    `input_format` is ``'candump'`` or ``'asc'``. Binary log files
+    cannot be split into chunks and are not supported.
+
+    Returns a generator of ``(timestamp, message, signals)`` tuples in
+    log file order, just as
+    :func:`~cantools.logreader.decode_stream()`.
+
+    Keyword arguments `kwargs` are passed to
+    :func:`~cantools.database.load_file()`.
+
+    >>> for timestamp, message, signals in decode_file('foo.dbc', 'foo.log', jobs=4):
+    ...     print(timestamp, message.name, signals)
+
+    """
+
+    # Load the database here first to raise any errors in this
+    # process, as a failing pool initializer restarts the workers
+    # forever.
+    dbase = database.load_file(database_path, **kwargs)
+    results = _run(_decode_chunk,
+                   database_path,
+                   log_path,
+                   jobs,
+                   input_format,
+                   chunk_size,
+                   kwargs,
+                   (decode_choices, scaling))
+
+    for decoded in results:
+        for timestamp, name, signals in decoded:
+            yield timestamp, dbase.get_message_by_name(name), signals
+
+
+def format_file(database_path,
+                log_path,
+                jobs=None,
+                input_format='candump',
+                decode_choices=True,
+                single_line=False,
+                chunk_size=CHUNK_SIZE,
+                **kwargs):
+    """Same as :func:`~cantools.parallel.decode_file()`, but returns a
+    generator of lists of lines formatted as by the decode
+    subcommand.
+
+    """
+
+    database.load_file(database_path, **kwargs)
+
+    return _run(_format_chunk,
+                database_path,
+                log_path,
+                jobs,
+                input_format,
+                chunk_size,
+                kwargs,
+                (decode_choices, single_line))
@@ -1,27 +1,92 @@
 from __future__ import print_function
 import sys
-import re
-import binascii
-import struct
+import io
 
 from .. import database
+from .. import logreader
+from .. import parallel
 from .utils import format_message_by_frame_id
 
 
-# Matches 'candump' output, i.e. "vcan0  1F0   [8]  00 00 00 00 00 00 1B C1".
-RE_CANDUMP = re.compile(r'^\s*\S+\s+([0-9A-F]+)\s*\[\d+\]\s*([0-9A-F ]*)$')
+def _format_frame(frame):
+    if frame.is_extended_frame:
+        frame_id = '{:08X}'.format(frame.frame_id)
+    else:
+        frame_id = '{:03X}'.format(frame.frame_id)
 
+    return '({:.6f})  {}   [{}]  {}'.format(
+        frame.timestamp,
+        frame_id,
+        len(frame.data),
+        ' '.join(['{:02X}'.format(byte) for byte in bytearray(frame.data)]))
 
-def _mo_unpack(mo):
-    frame_id = mo.group(1)
-    frame_id = '0' * (8 - len(frame_id)) + frame_id
-    frame_id = binascii.unhexlify(frame_id)
-    frame_id = struct.unpack('>I', frame_id)[0]
-    data = mo.group(2)
-    data = data.replace(' ', '')
-    data = binascii.unhexlify(data)
 
-    return frame_id, data
+def _open_input(args):
+    """Returns the log file object to read from, opened with a large
+    buffer, or standard input.
+
+    """
+
+    binary = (args.input_format == 'binary')
+
+    if args.infile is None:
+        if binary:
+            return getattr(sys.stdin, 'buffer', sys.stdin)
+        else:
+            return sys.stdin
+    elif binary:
+        return io.open(args.infile, 'rb', buffering=logreader.CHUNK_SIZE)
+    else:
+        return io.open(args.infile,
+                       'r',
+                       buffering=logreader.CHUNK_SIZE,
+                       errors='replace')
+
+
+def _decode_lines(dbase, lines, decode_choices, single_line):
+    for line, frame in lines:
+        line = line.rstrip('\r\n')
+
+        if frame is not None:
+            line += ' ::'
+            line += format_message_by_frame_id(dbase,
+                                               frame.frame_id,
+                                               frame.data,
+                                               decode_choices,
+                                               single_line)
+
+        print(line)
+
+
+def _decode_frames(dbase, frames, decode_choices, single_line):
+    for frame in frames:
+        line = _format_frame(frame)
+        line += ' ::'
+        line += format_message_by_frame_id(dbase,
+                                           frame.frame_id,
+                                           frame.data,
+                                           decode_choices,
+                                           single_line)
+        print(line)
+
+
+def _do_decode_parallel(args, decode_choices):
+    if args.infile is None:
+        raise Exception('--jobs requires a log file')
+
+    results = parallel.format_file(args.database,
+                                   args.infile,
+                                   args.jobs,
+                                   args.input_format,
+                                   decode_choices,
+                                   args.single_line,
+                                   encoding=args.encoding,
+                                   frame_id_mask=args.frame_id_mask,
+                                   strict=not args.no_strict)
+
+    for lines in results:
+        for line in lines:
+            print(line)
 
 
 def _do_decode(args):
@@ -31,33 +96,35 @@ def _do_decode(args):
                                strict=not args.no_strict)
     decode_choices = not args.no_decode_choices
 
-    while True:
-        line = sys.stdin.readline()
+    if args.jobs > 1:
+        _do_decode_parallel(args, decode_choices)
 
-        # Break at EOF.
-        if not line:
-            break
+        return
 
-        line = line.strip('\r\n')
-        mo = RE_CANDUMP.match(line)
+    fin = _open_input(args)
 
-        if mo:
-            frame_id, data = _mo_unpack(mo)
-            line += ' ::'
-            line += format_message_by_frame_id(dbase,
-                                               frame_id,
-                                               data,
-                                               decode_choices,
-                                               args.single_line)
-
-        print(line)
+    try:
+        if args.input_format == 'binary':
+            _decode_frames(dbase,
+                           logreader.read_binary(fin),
+                           decode_choices,
+                           args.single_line)
+        else:
+            _decode_lines(dbase,
+                          logreader.LINE_ITERATORS[args.input_format](fin),
+                          decode_choices,
+                          args.single_line)
+    finally:
+        if args.infile is not None:
+            fin.close()
 
 
 def add_subparser(subparsers):
     decode_parser = subparsers.add_parser(
         'decode',
         description=('Decode "candump" CAN frames read from standard input '
-                     'and print them in a human readable format.'))
+                     'or a log file and print them in a human readable '
+                     'format.'))
     decode_parser.add_argument(
         '-c', '--no-decode-choices',
         action='store_true',
@@ -79,7 +146,23 @@ def add_subparser(subparsers):
         help=('Only compare selected frame id bits to find the message in the '
               'database. By default the candump and database frame ids must '
               'be equal for a match.'))
+    decode_parser.add_argument(
+        '-i', '--input-format',
+        choices=sorted(logreader.READERS),
+        default='candump',
+        help=('Log file format. candump reads both "candump" and "candump -L" '
+              'output (default: %(default)s).'))
+    decode_parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help=('Number of processes decoding the log file in parallel. Output '
+              'is printed in log file order (default: %(default)s).'))
     decode_parser.add_argument(
         'database',
         help='Database file.')
+    decode_parser.add_argument(
+        'infile',
+        nargs='?',
+        help='Log file to decode. Standard input is read if not given.')
     decode_parser.set_defaults(func=_do_decode)
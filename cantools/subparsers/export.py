@@ -0,0 +1,89 @@
+from __future__ import print_function
+import io
+
+from .. import database
+from .. import logreader
+from .. import export
+
+
+def _do_export(args):
+    dbase = database.load_file(args.database,
+                               encoding=args.encoding,
+                               frame_id_mask=args.frame_id_mask,
+                               strict=not args.no_strict)
+
+    if args.input_format == 'binary':
+        fin = io.open(args.infile, 'rb', buffering=logreader.CHUNK_SIZE)
+    else:
+        fin = io.open(args.infile,
+                      'r',
+                      buffering=logreader.CHUNK_SIZE,
+                      errors='replace')
+
+    with fin:
+        tables = export.export_frames(
+            dbase,
+            logreader.READERS[args.input_format](fin),
+            args.outdir,
+            args.output_format,
+            args.row_group_size,
+            args.decode_choices,
+            not args.no_scaling)
+
+    for name in sorted(tables):
+        print('{}: {} rows written to {}.'.format(name, *tables[name]))
+
+
+def add_subparser(subparsers):
+    export_parser = subparsers.add_parser(
+        'export',
+        description=('Decode given log file and write one table per message, '
+                     'with a timestamp column and one column per signal.'))
+    export_parser.add_argument(
+        '-e', '--encoding',
+        help='File encoding.')
+    export_parser.add_argument(
+        '--no-strict',
+        action='store_true',
+        help='Skip database consistency checks.')
+    export_parser.add_argument(
+        '-m', '--frame-id-mask',
+        type=lambda x: int(x, 0),
+        help=('Only compare selected frame id bits to find the message in the '
+              'database. By default the log file and database frame ids must '
+              'be equal for a match.'))
+    export_parser.add_argument(
+        '-i', '--input-format',
+        choices=sorted(logreader.READERS),
+        default='candump',
+        help='Log file format (default: %(default)s).')
+    export_parser.add_argument(
+        '-f', '--output-format',
+        choices=sorted(export.WRITERS),
+        default='npz',
+        help=('Output format. parquet requires pyarrow '
+              '(default: %(default)s).'))
+    export_parser.add_argument(
+        '-r', '--row-group-size',
+        type=int,
+        default=export.ROW_GROUP_SIZE,
+        help=('Number of rows buffered per message before they are written '
+              '(default: %(default)s).'))
+    export_parser.add_argument(
+        '-c', '--decode-choices',
+        action='store_true',
+        help='Export signals with choices as strings.')
+    export_parser.add_argument(
+        '--no-scaling',
+        action='store_true',
+        help='Do not scale signal values.')
+    export_parser.add_argument(
+        'database',
+        help='Database file.')
+    export_parser.add_argument(
+        'infile',
+        help='Log file to export.')
+    export_parser.add_argument(
+        'outdir',
+        help='Output directory, created if missing.')
+    export_parser.set_defaults(func=_do_export)
@@ -231,6 +231,7 @@ class Monitor(can.Listener):
     def try_update_message(self):
         message = self._queue.get_nowait()
         frame_id = message.arbitration_id
+        is_extended_frame = message.is_extended_id
         data = message.data
         timestamp = message.timestamp
 
@@ -240,9 +241,9 @@ class Monitor(can.Listener):
         timestamp -= self._basetime
         self._received += 1
 
-        try:
-            message = self._dbase.get_message_by_frame_id(frame_id)
-        except KeyError:
+        message = self._dbase.dispatcher.lookup(frame_id, is_extended_frame)
+
+        if message is None:
             self._discarded += 1
             return
 
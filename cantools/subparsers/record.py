@@ -0,0 +1,116 @@
+from __future__ import print_function
+import io
+import time
+
+import can
+
+from .. import logreader
+from ..capture import CaptureWriter
+
+
+def _record_bus(args, writer):
+    kwargs = {}
+
+    if args.bit_rate is not None:
+        kwargs['bitrate'] = int(args.bit_rate)
+
+    bus = can.Bus(bustype=args.bus_type, channel=args.channel, **kwargs)
+
+    if args.duration is not None:
+        end_time = time.time() + args.duration
+    else:
+        end_time = None
+
+    count = 0
+
+    try:
+        while args.count is None or count < args.count:
+            if end_time is None:
+                timeout = 1.0
+            else:
+                timeout = end_time - time.time()
+
+                if timeout <= 0:
+                    break
+
+            message = bus.recv(timeout)
+
+            if message is None:
+                continue
+
+            writer.write_can_message(message)
+            count += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bus.shutdown()
+
+    return count
+
+
+def _record_log_file(args, writer):
+    if args.input_format == 'binary':
+        fin = io.open(args.log_file, 'rb', buffering=logreader.CHUNK_SIZE)
+    else:
+        fin = io.open(args.log_file,
+                      'r',
+                      buffering=logreader.CHUNK_SIZE,
+                      errors='replace')
+
+    count = 0
+
+    with fin:
+        for frame in logreader.READERS[args.input_format](fin):
+            writer.write_frame(frame)
+            count += 1
+
+    return count
+
+
+def _do_record(args):
+    with CaptureWriter(args.outfile) as writer:
+        if args.log_file is None:
+            count = _record_bus(args, writer)
+        else:
+            count = _record_log_file(args, writer)
+
+    print('{} frames written to {}.'.format(count, args.outfile))
+
+
+def add_subparser(subparsers):
+    record_parser = subparsers.add_parser(
+        'record',
+        description=('Record CAN frames to a memory mapped capture file with '
+                     'a frame id index. Frames are received from a CAN bus '
+                     'until interrupted, or read from a log file.'))
+    record_parser.add_argument(
+        '-b', '--bus-type',
+        default='socketcan',
+        help='Python CAN bus type (default: socketcan).')
+    record_parser.add_argument(
+        '-c', '--channel',
+        default='vcan0',
+        help='Python CAN bus channel (default: vcan0).')
+    record_parser.add_argument(
+        '-B', '--bit-rate',
+        help='Python CAN bus bit rate.')
+    record_parser.add_argument(
+        '-n', '--count',
+        type=int,
+        help='Stop after given number of received frames.')
+    record_parser.add_argument(
+        '-d', '--duration',
+        type=float,
+        help='Stop after given number of seconds.')
+    record_parser.add_argument(
+        '-l', '--log-file',
+        help='Read frames from given log file instead of a CAN bus.')
+    record_parser.add_argument(
+        '-i', '--input-format',
+        choices=sorted(logreader.READERS),
+        default='candump',
+        help='Log file format (default: %(default)s).')
+    record_parser.add_argument(
+        'outfile',
+        help='Capture file to write.')
+    record_parser.set_defaults(func=_do_record)
@@ -45,10 +45,11 @@ class Listener(can.Listener):
         if msg.is_error_frame or msg.is_remote_frame:
             return
 
-        try:
-            database_message = self._database.get_message_by_frame_id(
-                msg.arbitration_id)
-        except KeyError:
+        database_message = self._database.dispatcher.lookup(
+            msg.arbitration_id,
+            msg.is_extended_id)
+
+        if database_message is None:
             return
 
         if database_message.name not in self._messages:
@@ -0,0 +1,265 @@
+import os
+import math
+import timeit
+import random
+import shutil
+import tempfile
+import unittest
+
+try:
+    from unittest.mock import Mock
+    from unittest.mock import patch
+except ImportError:
+    from mock import Mock
+    from mock import patch
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import can
+import cantools
+from cantools.capture import Capture
+from cantools.capture import CaptureWriter
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class CanToolsCaptureTest(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'foo.cap')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_write_and_read(self):
+        with CaptureWriter(self.filename, buffer_size=2) as writer:
+            writer.write(1.0, 0x1f0, b'\x80\x4a\x0f\x00\x00\x00\x00\x00')
+            writer.write(2.0,
+                         0x1f0,
+                         b'\x01',
+                         cantools.capture.FLAG_EXTENDED_FRAME)
+            writer.write(3.0, 0x1f3, b'\x01\x02\x03')
+            writer.write(4.0, 0x1f0, b'', cantools.capture.FLAG_REMOTE_FRAME)
+            writer.write(5.0, 0x1f0, b'\xc0\x06\xe0\x00\x00\x00\x00\x00')
+            writer.write(6.0, 0x1f0, b'\x80\x4a')
+
+        self.assertTrue(os.path.exists(self.filename + '.idx'))
+        self.assertEqual(os.path.getsize(self.filename), 7 * 80)
+
+        capture = Capture(self.filename)
+        self.assertEqual(len(capture), 6)
+        self.assertEqual(capture.records['timestamp'].tolist(),
+                         [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(capture.records['dlc'].tolist(), [8, 1, 3, 0, 8, 2])
+        self.assertEqual(capture.records['data'][2][:4].tolist(), [1, 2, 3, 0])
+        self.assertEqual(capture.frame_ids(),
+                         [(0x1f0, False), (0x1f0, True), (0x1f3, False)])
+        self.assertEqual(capture.record_numbers(0x1f0).tolist(), [0, 3, 4, 5])
+        self.assertEqual(capture.record_numbers(0x1f0, True).tolist(), [1])
+        self.assertEqual(capture.record_numbers(0x123).tolist(), [])
+        self.assertEqual(capture.read(0x1f3)['timestamp'].tolist(), [3.0])
+
+        # Remote frames and too short frames are skipped when decoding.
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        timestamps, signals = capture.decode_message(message)
+        self.assertEqual(timestamps.tolist(), [1.0, 5.0])
+        self.assertEqual(signals['Enable'].tolist(), ['Enabled', 'Enabled'])
+        self.assertEqual(signals['AverageRadius'].tolist(), [0.0, 3.2])
+        self.assertEqual(signals['Temperature'].tolist(), [255.92, 250.55])
+
+        # Data frames in capture order.
+        frames = list(capture.frames(chunk_size=4))
+        self.assertEqual([frame.timestamp for frame in frames],
+                         [1.0, 2.0, 3.0, 5.0, 6.0])
+        self.assertEqual(frames[1],
+                         cantools.logreader.Frame(2.0,
+                                                  0x1f0,
+                                                  b'\x01',
+                                                  True,
+                                                  None))
+
+    def test_missing_and_stale_index(self):
+        with CaptureWriter(self.filename) as writer:
+            writer.write(1.0, 0x1f0, b'\x01')
+
+        os.remove(self.filename + '.idx')
+        self.assertEqual(Capture(self.filename).record_numbers(0x1f0).tolist(),
+                         [0])
+        self.assertTrue(os.path.exists(self.filename + '.idx'))
+
+        # Replace the capture file, but keep the old index file.
+        with open(self.filename + '.idx', 'rb') as fin:
+            index = fin.read()
+
+        with CaptureWriter(self.filename) as writer:
+            writer.write(1.0, 0x1f3, b'\x01')
+            writer.write(2.0, 0x1f0, b'\x01')
+
+        with open(self.filename + '.idx', 'wb') as fout:
+            fout.write(index)
+
+        self.assertEqual(Capture(self.filename).record_numbers(0x1f0).tolist(),
+                         [1])
+
+    def test_empty(self):
+        with CaptureWriter(self.filename):
+            pass
+
+        capture = Capture(self.filename)
+        self.assertEqual(len(capture), 0)
+        self.assertEqual(capture.frame_ids(), [])
+        self.assertEqual(list(capture.frames()), [])
+
+    def test_bad_files(self):
+        with open(self.filename, 'wb') as fout:
+            fout.write(b'CANTLOG1')
+
+        with self.assertRaises(cantools.Error) as cm:
+            Capture(self.filename)
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected capture file magic b'CANTCAP1', but got b'CANTLOG1'")
+
+        with CaptureWriter(self.filename) as writer:
+            writer.write(1.0, 0x1f0, b'\x01')
+
+            with self.assertRaises(cantools.Error) as cm:
+                writer.write(1.0, 0x1f0, 65 * b'\x01')
+
+            self.assertEqual(str(cm.exception),
+                             'expected at most 64 data bytes, but got 65')
+
+        with open(self.filename, 'ab') as fout:
+            fout.write(b'\x00')
+
+        with self.assertRaises(cantools.Error) as cm:
+            Capture(self.filename)
+
+        self.assertEqual(
+            str(cm.exception),
+            'capture file ended with a truncated record of 1 byte(s)')
+
+    def test_record_log_file(self):
+        argv = [
+            'cantools',
+            'record',
+            '--log-file', 'tests/files/logs/candump.log',
+            self.filename
+        ]
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout):
+            with patch('sys.argv', argv):
+                cantools._main()
+
+        self.assertEqual(stdout.getvalue(),
+                         '4 frames written to {}.\n'.format(self.filename))
+        capture = Capture(self.filename)
+        self.assertEqual(capture.record_numbers(0x1f0).tolist(), [0, 1, 3])
+
+    @patch('can.Bus')
+    def test_record_bus(self, bus):
+        messages = [
+            can.Message(timestamp=1.0,
+                        arbitration_id=0x1f0,
+                        is_extended_id=False,
+                        data=b'\x80\x4a\x0f\x00\x00\x00\x00\x00'),
+            None,
+            can.Message(timestamp=2.0,
+                        arbitration_id=0x12345678,
+                        is_extended_id=True,
+                        data=b'\x01'),
+            can.Message(timestamp=3.0,
+                        arbitration_id=0x1f0,
+                        is_extended_id=False,
+                        is_remote_frame=True)
+        ]
+        bus.return_value.recv = Mock(side_effect=messages)
+        argv = [
+            'cantools',
+            'record',
+            '--bus-type', 'virtual',
+            '--count', '3',
+            self.filename
+        ]
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout):
+            with patch('sys.argv', argv):
+                cantools._main()
+
+        self.assertEqual(stdout.getvalue(),
+                         '3 frames written to {}.\n'.format(self.filename))
+        bus.assert_called_once_with(bustype='virtual', channel='vcan0')
+        bus.return_value.shutdown.assert_called_once_with()
+        records = Capture(self.filename).records
+        self.assertEqual(records['frame_id'].tolist(),
+                         [0x1f0, 0x12345678, 0x1f0])
+        self.assertEqual(records['flags'].tolist(),
+                         [0,
+                          cantools.capture.FLAG_EXTENDED_FRAME,
+                          cantools.capture.FLAG_REMOTE_FRAME])
+
+    def test_performance_decode_message(self):
+        """Compare the time to decode all frames of one message using the
+        index to decoding the whole capture.
+
+        """
+
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        randomizer = random.Random(0)
+
+        with CaptureWriter(self.filename) as writer:
+            for i in range(200000):
+                if i % 100 == 0:
+                    frame_id = 0x1f0
+                else:
+                    frame_id = randomizer.randint(0x200, 0x7ff)
+
+                writer.write(0.001 * i,
+                             frame_id,
+                             b'\x80\x4a\x0f\x00\x00\x00\x00\x00')
+
+        capture = Capture(self.filename)
+
+        def decode_stream():
+            return [
+                signals
+                for _, decoded_message, signals in cantools.logreader.decode_stream(
+                        db,
+                        capture.frames())
+                if decoded_message is message
+            ]
+
+        def decode_message():
+            return capture.decode_message(message)
+
+        decode_stream_time = timeit.timeit(decode_stream, number=1)
+        decode_message_time = timeit.timeit(decode_message, number=1)
+        timestamps, signals = decode_message()
+        self.assertEqual(len(timestamps), 2000)
+        self.assertEqual(len(decode_stream()), 2000)
+        self.assertTrue(math.isclose(timestamps[-1], 199.9))
+
+        print()
+        print("decode stream time: {} s, decode message time: {} s "
+              "({:.1f}x)".format(decode_stream_time,
+                                 decode_message_time,
+                                 decode_stream_time / decode_message_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import sys
 import os
 import re
+import tempfile
 import unittest
 
 try:
@@ -113,6 +114,124 @@ CanFd(
                     actual_output = stdout.getvalue()
                     self.assertEqual(actual_output, expected_output)
 
+    def test_decode_log_file(self):
+        argv = [
+            'cantools',
+            'decode',
+            '--single-line',
+            'tests/files/dbc/motohawk.dbc',
+            'tests/files/logs/candump.log'
+        ]
+
+        expected_output = """\
+(1579857014.345944) vcan0 1F0#804A0F0000000000 :: ExampleMessage(Enable: 'Enabled' -, AverageRadius: 0.0 m, Temperature: 255.92 degK)
+(1579857014.355981) vcan0 1F0#C006E00000000000 :: ExampleMessage(Enable: 'Enabled' -, AverageRadius: 3.2 m, Temperature: 250.55 degK)
+(1579857014.356000) vcan0 1F1#R
+(1579857014.365944) vcan0 1F3#010203 :: Unknown frame id 499 (0x1f3)
+(1579857014.375944) vcan0 1F0#804A0F :: unpack requires at least 64 bits to unpack (got 24)
+"""
+
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout):
+            with patch('sys.argv', argv):
+                cantools._main()
+                actual_output = stdout.getvalue()
+                self.assertEqual(actual_output, expected_output)
+
+    def test_decode_asc(self):
+        argv = [
+            'cantools',
+            'decode',
+            '--single-line',
+            '--input-format', 'asc',
+            'tests/files/dbc/motohawk.dbc',
+            'tests/files/logs/vector.asc'
+        ]
+
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout):
+            with patch('sys.argv', argv):
+                cantools._main()
+                actual_output = stdout.getvalue().splitlines()
+
+        self.assertEqual(len(actual_output), 13)
+        self.assertEqual(actual_output[1], 'base hex  timestamps absolute')
+        self.assertEqual(
+            actual_output[7],
+            "   0.025991 1  1F0             Tx   d 8 C0 06 E0 00 00 00 00 00 :: "
+            "ExampleMessage(Enable: 'Enabled' -, AverageRadius: 3.2 m, "
+            "Temperature: 250.55 degK)")
+        self.assertEqual(
+            actual_output[10],
+            "   0.045991 2  1F3             Rx   d 3 01 02 03 :: "
+            "Unknown frame id 499 (0x1f3)")
+
+    def test_decode_binary(self):
+        frames = [
+            cantools.logreader.Frame(1.5,
+                                     0x1f0,
+                                     b'\x80\x4a\x0f\x00\x00\x00\x00\x00',
+                                     False,
+                                     None),
+            cantools.logreader.Frame(2.25, 0x12345678, b'\x01', True, None)
+        ]
+
+        with tempfile.NamedTemporaryFile(suffix='.bin', delete=False) as fout:
+            cantools.logreader.write_binary(fout, frames)
+
+        argv = [
+            'cantools',
+            'decode',
+            '--single-line',
+            '--input-format', 'binary',
+            'tests/files/dbc/motohawk.dbc',
+            fout.name
+        ]
+
+        expected_output = """\
+(1.500000)  1F0   [8]  80 4A 0F 00 00 00 00 00 :: ExampleMessage(Enable: 'Enabled' -, AverageRadius: 0.0 m, Temperature: 255.92 degK)
+(2.250000)  12345678   [1]  01 :: Unknown frame id 305419896 (0x12345678)
+"""
+
+        stdout = StringIO()
+
+        try:
+            with patch('sys.stdout', stdout):
+                with patch('sys.argv', argv):
+                    cantools._main()
+                    actual_output = stdout.getvalue()
+                    self.assertEqual(actual_output, expected_output)
+        finally:
+            os.remove(fout.name)
+
+    def test_decode_jobs(self):
+        argv = [
+            'cantools',
+            'decode',
+            '--single-line',
+            '--jobs', '2',
+            'tests/files/dbc/motohawk.dbc',
+            'tests/files/logs/candump.log'
+        ]
+
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout):
+            with patch('sys.argv', argv[:3] + argv[5:]):
+                cantools._main()
+                expected_output = stdout.getvalue()
+
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout):
+            with patch('sys.argv', argv):
+                cantools._main()
+                actual_output = stdout.getvalue()
+
+        self.assertEqual(actual_output, expected_output)
+
     def test_single_line_decode(self):
         argv = [
             'cantools',
@@ -8,6 +8,9 @@ from collections import namedtuple
 import textparser
 import os
 import re
+import glob
+import random
+import binascii
 
 try:
     from unittest.mock import patch
@@ -23,11 +26,31 @@ try:
 except ImportError:
     from io import StringIO
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 import cantools
 from cantools.database.can.formats import dbc
 from cantools.database import UnsupportedDatabaseFormatError
 
 
+def create_bitstruct_formats(message, node):
+    """Create and cache bitstruct formats of given codec node, used as a
+    reference when testing the encode and decode plans.
+
+    """
+
+    if 'bitstruct_formats' not in node:
+        node['bitstruct_formats'] = (
+            cantools.database.utils.create_encode_decode_formats(
+                node['signals'],
+                message.length))
+
+    return node['bitstruct_formats']
+
+
 class CanToolsDatabaseTest(unittest.TestCase):
 
     maxDiff = None
@@ -2627,6 +2650,433 @@ class CanToolsDatabaseTest(unittest.TestCase):
 
         print("Decode time: {} s ({} s/decode)".format(time, time / iterations))
 
+    def test_performance_decode_plan(self):
+        """Compare decode performance of the precompiled decode plans to
+        the bitstruct based decoder, and make sure both gives the same
+        result.
+
+        """
+
+        iterations = 10000
+
+        def bitstruct_decode(message, node, data):
+            decoded = cantools.database.utils.decode_data(
+                data,
+                node['signals'],
+                create_bitstruct_formats(message, node),
+                True,
+                True)
+
+            for signal, multiplexers in node['multiplexers'].items():
+                mux = decoded[signal]
+
+                if isinstance(mux, str):
+                    mux = message.get_signal_by_name(
+                        signal).choice_string_to_number(mux)
+
+                decoded.update(bitstruct_decode(message,
+                                                multiplexers[mux],
+                                                data))
+
+            return decoded
+
+        motohawk = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        multiplex = cantools.database.load_file('tests/files/dbc/multiplex.dbc')
+        signals = [
+            cantools.db.Signal('S0', 0, 4),
+            cantools.db.Signal('S1', 7, 4, 'big_endian', is_signed=True),
+            cantools.db.Signal('S2', 12, 12, scale=0.5, offset=-3),
+            cantools.db.Signal('S3', 31, 8, 'big_endian', choices={1: 'One'}),
+            cantools.db.Signal('S4', 32, 32, is_float=True)
+        ]
+        mixed = cantools.db.Message(frame_id=1,
+                                    name='Mixed',
+                                    length=8,
+                                    signals=signals)
+        datasets = [
+            (motohawk.get_message_by_name('ExampleMessage'),
+             b'\xc0\x06\xe0\x00\x00\x00\x00\x00'),
+            (multiplex.get_message_by_name('Message1'),
+             b'\x60\x00\x8c\x35\xc3\x00\x00\x00'),
+            (mixed, b'\x9f\x12\x34\x01\x00\x00\x20\x41')
+        ]
+
+        print()
+
+        for message, data in datasets:
+            self.assertEqual(message.decode(data),
+                             bitstruct_decode(message, message._codecs, data))
+
+            bitstruct_time = timeit.timeit(
+                lambda: bitstruct_decode(message, message._codecs, data),
+                number=iterations)
+            plan_time = timeit.timeit(lambda: message.decode(data),
+                                      number=iterations)
+
+            print("{}: bitstruct decode time: {} s, plan decode time: {} s "
+                  "({:.1f}x)".format(message.name,
+                                     bitstruct_time,
+                                     plan_time,
+                                     bitstruct_time / plan_time))
+
+    def test_encode_plan_bitstruct_equivalence(self):
+        """Encode random signal values in all messages and DIDs in the
+        test files, and make sure the encode plans gives the same
+        result as the bitstruct based encoder.
+
+        """
+
+        randomizer = random.Random(0)
+
+        def bitstruct_encode(message, node, data):
+            formats = create_bitstruct_formats(message, node)
+            encoded = cantools.database.utils.encode_data(data,
+                                                          node['signals'],
+                                                          formats,
+                                                          True)
+            padding_mask = formats.padding_mask
+
+            for signal, multiplexers in node['multiplexers'].items():
+                mux_encoded, mux_padding_mask = bitstruct_encode(
+                    message,
+                    multiplexers[data[signal]],
+                    data)
+                encoded |= mux_encoded
+                padding_mask &= mux_padding_mask
+
+            return encoded, padding_mask
+
+        def to_bytes(encoded, length):
+            encoded |= (0x80 << (8 * length))
+            encoded = hex(encoded)[4:].rstrip('L')
+
+            return binascii.unhexlify(encoded)[:length]
+
+        def random_value(signal):
+            if signal.is_float:
+                return randomizer.uniform(-1000, 1000) * signal.scale
+
+            if signal.is_signed:
+                raw = randomizer.randint(-(1 << (signal.length - 1)),
+                                         (1 << (signal.length - 1)) - 1)
+            else:
+                raw = randomizer.randint(0, (1 << signal.length) - 1)
+
+            # Values on and close to rounding boundaries.
+            fraction = randomizer.choice([0, 0.5, -0.5, 0.49999, 0.50001,
+                                          randomizer.random()])
+
+            return (raw + fraction) * signal.scale + signal.offset
+
+        def random_data(node, data):
+            for signal in node['signals']:
+                data[signal.name] = random_value(signal)
+
+            for signal, multiplexers in node['multiplexers'].items():
+                mux = randomizer.choice(sorted(multiplexers))
+                data[signal] = mux
+                random_data(multiplexers[mux], data)
+
+            return data
+
+        def assert_equal_encode(message, node, encode, length, padding):
+            for _ in range(20):
+                data = random_data(node, {})
+
+                try:
+                    expected = bitstruct_encode(message, node, data)
+                except Exception:
+                    with self.assertRaises(Exception):
+                        encode(data, False)
+
+                    continue
+
+                self.assertEqual(encode(data, False),
+                                 to_bytes(expected[0], length))
+
+                if padding:
+                    self.assertEqual(
+                        encode(data, True),
+                        to_bytes(expected[0] | expected[1], length))
+
+        filenames = []
+
+        for extension in ['arxml', 'dbc', 'kcd', 'sym']:
+            filenames += glob.glob('tests/files/{0}/*.{0}'.format(extension))
+
+        for filename in sorted(filenames):
+            try:
+                db = cantools.database.load_file(filename)
+            except Exception:
+                continue
+
+            for message in db.messages:
+                assert_equal_encode(
+                    message,
+                    message._codecs,
+                    lambda data, padding: message.encode(data,
+                                                         padding=padding,
+                                                         strict=False),
+                    message.length,
+                    True)
+
+        db = cantools.database.load_file('tests/files/cdd/example.cdd')
+
+        for did in db.dids:
+            assert_equal_encode(did,
+                                {'signals': did.datas, 'multiplexers': {}},
+                                lambda data, padding: did.encode(data),
+                                did.length,
+                                False)
+
+    def test_performance_encode_plan(self):
+        """Compare encode performance of the precompiled encode plans to
+        the bitstruct and decimal.Decimal based encoder.
+
+        """
+
+        iterations = 10000
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        data = {
+            'Temperature': 250.55,
+            'AverageRadius': 3.2,
+            'Enable': 'Enabled'
+        }
+
+        def bitstruct_encode():
+            encoded = cantools.database.utils.encode_data(
+                data,
+                message._codecs['signals'],
+                create_bitstruct_formats(message, message._codecs),
+                True)
+            encoded |= (0x80 << (8 * message.length))
+            encoded = hex(encoded)[4:].rstrip('L')
+
+            return binascii.unhexlify(encoded)[:message.length]
+
+        self.assertEqual(message.encode(data), bitstruct_encode())
+
+        bitstruct_time = timeit.timeit(bitstruct_encode, number=iterations)
+        plan_time = timeit.timeit(lambda: message.encode(data),
+                                  number=iterations)
+
+        print()
+        print("bitstruct encode time: {} s, plan encode time: {} s "
+              "({:.1f}x)".format(bitstruct_time,
+                                 plan_time,
+                                 bitstruct_time / plan_time))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_decode_batch(self):
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        frames = [
+            b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+            b'\x40\x06\xe0\x00\x00\x00\x00\x00',
+            b'\x80\xff\xff\x00\x00\x00\x00\x00'
+        ]
+
+        # Frames as a list of bytes and as an array.
+        for batch_frames in [frames,
+                             np.frombuffer(b''.join(frames),
+                                           dtype=np.uint8).reshape(3, 8)]:
+            decoded = message.decode_batch(batch_frames)
+
+            for i, frame in enumerate(frames):
+                for name, value in message.decode(frame).items():
+                    self.assertEqual(decoded[name][i], value)
+
+        # Choices as codes instead of strings.
+        decoded = message.decode_batch(frames, decode_choices=False)
+        self.assertEqual(decoded['Enable'].tolist(), [1, 0, 1])
+
+        # Absent multiplexed signals are NaN.
+        db = cantools.database.load_file('tests/files/dbc/multiplex_choices.dbc')
+        message = db.get_message_by_name('Message1')
+        frames = [
+            b'\x60\x00\x8c\x35\xc3\x00\x00\x00',
+            b'\x20\x00\x8c\x35\xc3\x00\x00\x00'
+        ]
+        decoded = message.decode_batch(frames)
+        self.assertEqual(decoded['Multiplexor'].tolist(),
+                         ['MULTIPLEXOR_24', 'MULTIPLEXOR_8'])
+        self.assertEqual(decoded['BIT_A'][0], 1)
+        self.assertTrue(math.isnan(decoded['BIT_A'][1]))
+        self.assertEqual(decoded['BIT_J'].tolist(), [1, 1])
+
+        # Too short frames.
+        with self.assertRaises(cantools.database.DecodeError):
+            message.decode_batch([b'\x60\x00'])
+
+        # Frames grouped by frame id.
+        db = cantools.database.load_file('tests/files/dbc/foobar.dbc')
+        decoded = db.decode_batch([0x12330, 0x1, 0x12331, 0x12330],
+                                  [b'\x01\x02\x03\x04\x05\x06\x07\x08',
+                                   b'\x00',
+                                   b'\x01\x02\x03\x04\x05\x06\x07\x08',
+                                   b'\x11\x12\x13\x14\x15\x16\x17\x18'])
+        self.assertEqual(sorted(decoded), ['Foo', 'Fum'])
+        indices, signals = decoded['Foo']
+        self.assertEqual(indices.tolist(), [0, 3])
+        message = db.get_message_by_name('Foo')
+
+        for i, frame in enumerate([b'\x01\x02\x03\x04\x05\x06\x07\x08',
+                                   b'\x11\x12\x13\x14\x15\x16\x17\x18']):
+            for name, value in message.decode(frame).items():
+                self.assertEqual(signals[name][i], value)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_performance_decode_batch(self):
+        """Compare decode performance of batch decoding to decoding one
+        frame at a time.
+
+        """
+
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        randomizer = random.Random(0)
+        frames = [
+            bytes(bytearray([randomizer.randint(0, 255) for _ in range(8)]))
+            for _ in range(10000)
+        ]
+
+        def decode():
+            return [message.decode(frame) for frame in frames]
+
+        def decode_batch():
+            return message.decode_batch(frames)
+
+        decode_time = timeit.timeit(decode, number=1)
+        decode_batch_time = timeit.timeit(decode_batch, number=1)
+
+        print()
+        print("decode time: {} s, decode batch time: {} s ({:.1f}x)".format(
+            decode_time,
+            decode_batch_time,
+            decode_time / decode_batch_time))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_encode_batch(self):
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        rows = [
+            {'Temperature': 250.1, 'AverageRadius': 3.2, 'Enable': 'Enabled'},
+            {'Temperature': 229.53, 'AverageRadius': 0.0, 'Enable': 0},
+            {'Temperature': 270.47, 'AverageRadius': 1.5, 'Enable': 1}
+        ]
+        columns = {
+            name: [row[name] for row in rows]
+            for name in rows[0]
+        }
+
+        for padding in [False, True]:
+            encoded = message.encode_batch(columns, padding=padding)
+            self.assertEqual(encoded.dtype, np.uint8)
+            self.assertEqual(encoded.shape, (3, 8))
+
+            for i, row in enumerate(rows):
+                self.assertEqual(encoded[i].tobytes(),
+                                 message.encode(row, padding=padding))
+
+        # Encoded frames can be decoded in a batch.
+        decoded = message.decode_batch(message.encode_batch(columns))
+        self.assertEqual(decoded['Enable'].tolist(),
+                         ['Enabled', 'Disabled', 'Enabled'])
+
+        # Values out of range.
+        with self.assertRaises(cantools.database.EncodeError) as cm:
+            message.encode_batch({'Temperature': [250.1, 300.0],
+                                  'AverageRadius': [3.2, 3.2],
+                                  'Enable': [1, 1]})
+
+        self.assertEqual(
+            str(cm.exception),
+            "Expected signal 'Temperature' value less than or equal to "
+            "270.47 in message 'ExampleMessage', but got 300.0.")
+
+        # Missing signals.
+        with self.assertRaises(cantools.database.EncodeError) as cm:
+            message.encode_batch({'Temperature': [250.1]})
+
+        self.assertEqual(
+            str(cm.exception),
+            "Expected signal value for 'Enable' in data, but got "
+            "['Temperature'].")
+
+        # Multiplexed signals are selected per frame.
+        db = cantools.database.load_file('tests/files/dbc/multiplex_choices.dbc')
+        message = db.get_message_by_name('Message1')
+        columns = {
+            'Multiplexor': ['MULTIPLEXOR_24', 'MULTIPLEXOR_8', 16],
+            'BIT_A': [1, np.nan, np.nan],
+            'BIT_B': [0, np.nan, np.nan],
+            'BIT_C': [1, 1, 0],
+            'BIT_D': [1, np.nan, np.nan],
+            'BIT_E': [0, np.nan, np.nan],
+            'BIT_F': [1, np.nan, np.nan],
+            'BIT_G': [0, 1, 1],
+            'BIT_H': [1, np.nan, np.nan],
+            'BIT_J': [1, 0, 1],
+            'BIT_K': [0, np.nan, np.nan],
+            'BIT_L': [1, 1, 0]
+        }
+        encoded = message.encode_batch(columns)
+
+        for i in range(3):
+            row = {
+                name: values[i]
+                for name, values in columns.items()
+                if not (isinstance(values[i], float) and math.isnan(values[i]))
+            }
+            self.assertEqual(encoded[i].tobytes(), message.encode(row))
+
+        columns['Multiplexor'][2] = 4
+
+        with self.assertRaises(cantools.database.EncodeError) as cm:
+            message.encode_batch(columns)
+
+        self.assertEqual(str(cm.exception),
+                         'expected multiplexer id 8, 16 or 24, but got 4')
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_performance_encode_batch(self):
+        """Compare encode performance of batch encoding to encoding one
+        frame at a time.
+
+        """
+
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        randomizer = random.Random(0)
+        rows = [
+            {
+                'Temperature': randomizer.randint(-2048, 2047) * 0.01 + 250,
+                'AverageRadius': randomizer.randint(0, 50) * 0.1,
+                'Enable': randomizer.randint(0, 1)
+            }
+            for _ in range(10000)
+        ]
+        columns = {
+            name: np.array([row[name] for row in rows])
+            for name in rows[0]
+        }
+
+        def encode():
+            return [message.encode(row, strict=False) for row in rows]
+
+        def encode_batch():
+            return message.encode_batch(columns, strict=False)
+
+        encode_time = timeit.timeit(encode, number=1)
+        encode_batch_time = timeit.timeit(encode_batch, number=1)
+
+        print()
+        print("encode time: {} s, encode batch time: {} s ({:.1f}x)".format(
+            encode_time,
+            encode_batch_time,
+            encode_time / encode_batch_time))
+
     def test_padding_one(self):
         """Test to encode a message with padding as one.
 
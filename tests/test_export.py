@@ -0,0 +1,180 @@
+import os
+import math
+import shutil
+import tempfile
+import unittest
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+import cantools
+from cantools.logreader import Frame
+
+
+FRAMES = [
+    Frame(1.0, 0x1f0, b'\x80\x4a\x0f\x00\x00\x00\x00\x00', False, None),
+    Frame(2.0, 0x1f3, b'\x01\x02\x03', False, None),
+    Frame(3.0, 0x1f0, b'\xc0\x06\xe0\x00\x00\x00\x00\x00', False, None),
+    Frame(4.0, 0x1f0, b'\x00\x00', False, None),
+    Frame(None, 0x1f0, b'\x40\x06\xe0\x00\x00\x00\x00\x00', False, None)
+]
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class CanToolsExportTest(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_export_npz(self):
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+
+        # A row group size of two splits the rows into row groups.
+        for row_group_size in [2, 1000]:
+            tables = cantools.export.export_frames(db,
+                                                   FRAMES,
+                                                   self.directory,
+                                                   row_group_size=row_group_size)
+            filename = os.path.join(self.directory, 'ExampleMessage.npz')
+            self.assertEqual(tables, {'ExampleMessage': (3, filename)})
+            self.assertEqual(os.listdir(self.directory),
+                             ['ExampleMessage.npz'])
+
+            with np.load(filename) as table:
+                self.assertEqual(sorted(table.files),
+                                 [
+                                     'AverageRadius',
+                                     'Enable',
+                                     'Temperature',
+                                     'timestamp'
+                                 ])
+                self.assertEqual(table['timestamp'][:2].tolist(), [1.0, 3.0])
+                self.assertTrue(math.isnan(table['timestamp'][2]))
+                self.assertEqual(table['Enable'].dtype, np.int64)
+                self.assertEqual(table['Enable'].tolist(), [1, 1, 0])
+                self.assertEqual(table['AverageRadius'].tolist(),
+                                 [0.0, 3.2, 3.2])
+                self.assertEqual(table['Temperature'].tolist(),
+                                 [255.92, 250.55, 250.55])
+
+    def test_export_choices_and_multiplexing(self):
+        db = cantools.database.load_file(
+            'tests/files/dbc/multiplex_choices.dbc')
+        message = db.get_message_by_name('Message1')
+        frames = [
+            Frame(1.0,
+                  message.frame_id,
+                  b'\x60\x00\x8c\x35\xc3\x00\x00\x00',
+                  True,
+                  None),
+            Frame(2.0,
+                  message.frame_id,
+                  b'\x20\x00\x8c\x35\xc3\x00\x00\x00',
+                  True,
+                  None)
+        ]
+        tables = cantools.export.export_frames(db,
+                                               frames,
+                                               self.directory,
+                                               decode_choices=True)
+
+        with np.load(tables['Message1'][1]) as table:
+            self.assertEqual(table['Multiplexor'].tolist(),
+                             ['MULTIPLEXOR_24', 'MULTIPLEXOR_8'])
+            self.assertEqual(table['BIT_A'][0], 1.0)
+            self.assertTrue(math.isnan(table['BIT_A'][1]))
+            self.assertEqual(table['BIT_J'].tolist(), [1.0, 1.0])
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_export_parquet(self):
+        db = cantools.database.load_file(
+            'tests/files/dbc/multiplex_choices.dbc')
+        message = db.get_message_by_name('Message1')
+        frames = [
+            Frame(1.0,
+                  message.frame_id,
+                  b'\x60\x00\x8c\x35\xc3\x00\x00\x00',
+                  True,
+                  None),
+            Frame(2.0,
+                  message.frame_id,
+                  b'\x20\x00\x8c\x35\xc3\x00\x00\x00',
+                  True,
+                  None),
+            Frame(3.0,
+                  message.frame_id,
+                  b'\x60\x00\x8c\x35\xc3\x00\x00\x00',
+                  True,
+                  None)
+        ]
+        tables = cantools.export.export_frames(db,
+                                               frames,
+                                               self.directory,
+                                               output_format='parquet',
+                                               row_group_size=2,
+                                               decode_choices=True)
+        parquet_file = pq.ParquetFile(tables['Message1'][1])
+        self.assertEqual(parquet_file.num_row_groups, 2)
+        table = parquet_file.read().to_pydict()
+        self.assertEqual(table['timestamp'], [1.0, 2.0, 3.0])
+        self.assertEqual(table['Multiplexor'],
+                         ['MULTIPLEXOR_24', 'MULTIPLEXOR_8', 'MULTIPLEXOR_24'])
+        self.assertEqual(table['BIT_A'], [1.0, None, 1.0])
+
+    def test_export_bad_output_format(self):
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+
+        with self.assertRaises(cantools.Error) as cm:
+            cantools.export.export_frames(db, FRAMES, self.directory, 'csv')
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected output format in ['npz', 'parquet'], but got 'csv'")
+
+    def test_command_line(self):
+        argv = [
+            'cantools',
+            'export',
+            'tests/files/dbc/motohawk.dbc',
+            'tests/files/logs/candump.log',
+            self.directory
+        ]
+        filename = os.path.join(self.directory, 'ExampleMessage.npz')
+        expected_output = 'ExampleMessage: 2 rows written to {}.\n'.format(
+            filename)
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout):
+            with patch('sys.argv', argv):
+                cantools._main()
+                self.assertEqual(stdout.getvalue(), expected_output)
+
+        with np.load(filename) as table:
+            self.assertEqual(table['timestamp'].tolist(),
+                             [1579857014.345944, 1579857014.355981])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+import io
+import unittest
+
+import cantools
+from cantools.logreader import Frame
+
+
+class CanToolsLogReaderTest(unittest.TestCase):
+
+    maxDiff = None
+
+    def test_read_candump_log(self):
+        with open('tests/files/logs/candump.log', 'r') as fin:
+            frames = list(cantools.logreader.read_candump(fin))
+
+        self.assertEqual(
+            frames,
+            [
+                Frame(1579857014.345944,
+                      0x1f0,
+                      b'\x80\x4a\x0f\x00\x00\x00\x00\x00',
+                      False,
+                      'vcan0'),
+                Frame(1579857014.355981,
+                      0x1f0,
+                      b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                      False,
+                      'vcan0'),
+                Frame(1579857014.365944,
+                      0x1f3,
+                      b'\x01\x02\x03',
+                      False,
+                      'vcan0'),
+                Frame(1579857014.375944,
+                      0x1f0,
+                      b'\x80\x4a\x0f',
+                      False,
+                      'vcan0')
+            ])
+
+    def test_read_candump(self):
+        with open('tests/files/logs/candump.txt', 'r') as fin:
+            frames = list(cantools.logreader.read_candump(fin))
+
+        self.assertEqual(
+            frames,
+            [
+                Frame(1579857014.345944,
+                      0x1f0,
+                      b'\x80\x4a\x0f\x00\x00\x00\x00\x00',
+                      False,
+                      None),
+                Frame(1579857014.355981,
+                      0x1f0,
+                      b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                      False,
+                      None),
+                Frame(None,
+                      0x1f0,
+                      b'\x80\x4a\x0f\x00\x00\x00\x00\x00',
+                      False,
+                      None)
+            ])
+
+    def test_read_candump_extended_and_can_fd(self):
+        frames = list(cantools.logreader.read_candump([
+            '(1.5) can1 12345678#0102',
+            '(2.5) can1 123##1AABBCCDD',
+            '  vcan0  12333 [2]  02 00'
+        ]))
+
+        self.assertEqual(
+            frames,
+            [
+                Frame(1.5, 0x12345678, b'\x01\x02', True, 'can1'),
+                Frame(2.5, 0x123, b'\xaa\xbb\xcc\xdd', False, 'can1'),
+                Frame(None, 0x12333, b'\x02\x00', True, None)
+            ])
+
+    def test_read_asc(self):
+        with open('tests/files/logs/vector.asc', 'r') as fin:
+            frames = list(cantools.logreader.read_asc(fin))
+
+        self.assertEqual(len(frames), 4)
+        self.assertEqual(frames[0],
+                         Frame(0.015991,
+                               0x1f0,
+                               b'\x80\x4a\x0f\x00\x00\x00\x00\x00',
+                               False,
+                               '1'))
+        self.assertEqual(frames[2],
+                         Frame(0.045991, 0x1f3, b'\x01\x02\x03', False, '2'))
+        self.assertEqual(frames[3].frame_id, 0x12333)
+        self.assertTrue(frames[3].is_extended_frame)
+        self.assertEqual(frames[3].data, b'\x02' + 7 * b'\x00' + b'\x01' + 55 * b'\x00')
+
+    def test_read_asc_decimal_base(self):
+        frames = list(cantools.logreader.read_asc([
+            'base dec  timestamps absolute',
+            '   1.000000 1  496             Rx   d 2 128 74'
+        ]))
+
+        self.assertEqual(frames, [Frame(1.0, 496, b'\x80\x4a', False, '1')])
+
+    def test_read_write_binary(self):
+        frames = [
+            Frame(1.0, 0x1f0, b'\x80\x4a\x0f\x00\x00\x00\x00\x00', False, None),
+            Frame(2.0, 0x12345678, b'', True, None),
+            Frame(3.0, 0x12333, 64 * b'\x55', True, None)
+        ]
+        fout = io.BytesIO()
+        cantools.logreader.write_binary(fout, frames)
+
+        # Read a few bytes at a time to split records between chunks.
+        for chunk_size in [1, 7, 1024]:
+            fin = io.BytesIO(fout.getvalue())
+            self.assertEqual(
+                list(cantools.logreader.read_binary(fin, chunk_size)),
+                frames)
+
+        with self.assertRaises(cantools.Error) as cm:
+            list(cantools.logreader.read_binary(io.BytesIO(b'CANTLOG0')))
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected binary log file magic b'CANTLOG1', but got b'CANTLOG0'")
+
+        with self.assertRaises(cantools.Error) as cm:
+            list(cantools.logreader.read_binary(
+                io.BytesIO(fout.getvalue()[:-1])))
+
+        self.assertEqual(
+            str(cm.exception),
+            'binary log file ended with a truncated record of 76 byte(s)')
+
+    def test_decode_stream(self):
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+
+        with open('tests/files/logs/candump.log', 'r') as fin:
+            decoded = list(cantools.logreader.decode_stream(
+                db,
+                cantools.logreader.read_candump(fin)))
+
+        self.assertEqual(len(decoded), 2)
+        timestamp, message, signals = decoded[0]
+        self.assertEqual(timestamp, 1579857014.345944)
+        self.assertEqual(message.name, 'ExampleMessage')
+        self.assertEqual(signals,
+                         {
+                             'Enable': 'Enabled',
+                             'AverageRadius': 0.0,
+                             'Temperature': 255.92
+                         })
+        self.assertEqual(decoded[1][2]['Enable'], 'Enabled')
+        self.assertEqual(decoded[1][2]['AverageRadius'], 3.2)
+
+        # Choices and scaling.
+        with open('tests/files/logs/candump.log', 'r') as fin:
+            decoded = list(cantools.logreader.decode_stream(
+                db,
+                cantools.logreader.read_candump(fin),
+                decode_choices=False,
+                scaling=False))
+
+        self.assertEqual(decoded[0][2],
+                         {
+                             'Enable': 1,
+                             'AverageRadius': 0,
+                             'Temperature': 592
+                         })
+
+        # Unknown frame ids and frames that cannot be decoded raise
+        # exceptions in strict mode.
+        with open('tests/files/logs/candump.log', 'r') as fin:
+            decoded = cantools.logreader.decode_stream(
+                db,
+                cantools.logreader.read_candump(fin),
+                strict=True)
+
+            with self.assertRaises(cantools.Error) as cm:
+                list(decoded)
+
+            self.assertEqual(str(cm.exception), 'unknown frame id 499 (0x1f3)')
+
+        decoded = cantools.logreader.decode_stream(
+            db,
+            [Frame(None, 0x1f0, b'\x80', False, None)],
+            strict=True)
+
+        with self.assertRaises(cantools.database.DecodeError):
+            list(decoded)
+
+
+if __name__ == '__main__':
+    unittest.main()
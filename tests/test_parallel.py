@@ -0,0 +1,93 @@
+import os
+import random
+import tempfile
+import unittest
+
+import cantools
+
+
+class CanToolsParallelTest(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+        randomizer = random.Random(0)
+
+        with tempfile.NamedTemporaryFile('w',
+                                         suffix='.log',
+                                         delete=False) as fout:
+            for i in range(1000):
+                frame_id = randomizer.choice(['1F0', '1F3'])
+                data = ''.join(['{:02X}'.format(randomizer.randint(0, 255))
+                                for _ in range(8)])
+                fout.write('({:.6f}) vcan0 {}#{}\n'.format(0.01 * i,
+                                                           frame_id,
+                                                           data))
+
+        self.log_path = fout.name
+
+    def tearDown(self):
+        os.remove(self.log_path)
+
+    def test_split_file(self):
+        ranges = cantools.parallel.split_file(self.log_path, 1000)
+
+        with open(self.log_path, 'rb') as fin:
+            data = fin.read()
+
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(data))
+
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1:end], b'\n')
+
+        self.assertEqual(cantools.parallel.split_file(self.log_path, 10 ** 9),
+                         [(0, len(data))])
+
+    def test_decode_file(self):
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+
+        with open(self.log_path, 'r') as fin:
+            expected = list(cantools.logreader.decode_stream(
+                db,
+                cantools.logreader.read_candump(fin)))
+
+        actual = list(cantools.parallel.decode_file(
+            'tests/files/dbc/motohawk.dbc',
+            self.log_path,
+            jobs=3,
+            chunk_size=1000))
+
+        self.assertEqual(len(actual), len(expected))
+
+        for (timestamp, message, signals), expected_decoded in zip(actual,
+                                                                   expected):
+            self.assertEqual(timestamp, expected_decoded[0])
+            self.assertEqual(message.name, expected_decoded[1].name)
+            self.assertEqual(signals, expected_decoded[2])
+
+    def test_decode_file_asc(self):
+        actual = list(cantools.parallel.decode_file(
+            'tests/files/dbc/motohawk.dbc',
+            'tests/files/logs/vector.asc',
+            jobs=2,
+            input_format='asc',
+            chunk_size=100))
+
+        self.assertEqual([decoded[0] for decoded in actual],
+                         [0.015991, 0.025991])
+
+    def test_decode_file_binary(self):
+        with self.assertRaises(cantools.Error) as cm:
+            list(cantools.parallel.decode_file('tests/files/dbc/motohawk.dbc',
+                                               self.log_path,
+                                               input_format='binary'))
+
+        self.assertEqual(
+            str(cm.exception),
+            'parallel decoding of the binary log file format is not supported')
+
+
+if __name__ == '__main__':
+    unittest.main()